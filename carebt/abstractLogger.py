@@ -34,6 +34,13 @@ class AbstractLogger(ABC):
 
     The `AbstractLogger` interface has to be implemented for
     a custom logger.
+
+    The careBT nodes call `is_enabled_for` before building trace and debug
+    messages. By default it compares against the level set with
+    `set_log_level`, which is initialized by `AbstractLogger.__init__`. If the
+    custom logger does not call `super().__init__()` all messages are passed
+    to it. A custom logger which filters the messages by its own level should
+    override `is_enabled_for` accordingly.
     """
 
     def __init__(self):
@@ -42,6 +49,27 @@ class AbstractLogger(ABC):
     def set_log_level(self, log_level: LogLevel):
         self._log_level = log_level
 
+    def is_enabled_for(self, log_level: LogLevel) -> bool:
+        """Return if messages of the provided level are logged.
+
+        Allows to skip building expensive log messages in case they would
+        be discarded anyway.
+
+        Parameters
+        ----------
+        log_level: LogLevel
+            The level of the message
+
+        Returns
+        -------
+        bool
+            True if messages of the provided level are logged
+
+        """
+        # loggers which do not call super().__init__() filter the messages themselves
+        log_level_threshold = getattr(self, '_log_level', None)
+        return log_level_threshold is None or log_level_threshold <= log_level
+
     @abstractmethod
     def trace(self, msg: str):
         raise NotImplementedError
@@ -13,9 +13,11 @@
 # limitations under the License.
 
 from abc import ABC
-from datetime import datetime
+from time import monotonic_ns
 from typing import TYPE_CHECKING
 
+from carebt.abstractLogger import LogLevel
+from carebt.nodeStatus import IDLE_OR_RUNNING
 from carebt.nodeStatus import NodeStatus
 from carebt.treeNode import TreeNode
 
@@ -40,6 +42,8 @@ class ActionNode(TreeNode, ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         """Init the `ActionNode` with bt_runner and params."""
         super().__init__(bt_runner, params)
@@ -48,13 +52,13 @@ class ActionNode(TreeNode, ABC):
     # PROTECTED
 
     def _internal_on_tick(self) -> None:
-        current_ts = datetime.now()
-        if(self._throttle_ms is None or
-                int((current_ts - self._last_ts).total_seconds() * 1000) >= self._throttle_ms):
-            if(self.get_status() == NodeStatus.IDLE or
-                    self.get_status() == NodeStatus.RUNNING):
-                self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} - '
-                                                  + f'{self.get_status()}')
+        current_ts = monotonic_ns()
+        if(self._throttle_ns is None or self._last_ts is None
+                or current_ts - self._last_ts >= self._throttle_ns):
+            if(self.get_status() in IDLE_OR_RUNNING):
+                logger = self.get_logger()
+                if(logger.is_enabled_for(LogLevel.TRACE)):
+                    logger.trace(f'ticking {self.__class__.__name__} - {self.get_status()}')
                 self.on_tick()
                 self._last_ts = current_ts
 
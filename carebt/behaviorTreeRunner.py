@@ -16,6 +16,7 @@ from time import sleep
 
 from carebt.abstractLogger import AbstractLogger, LogLevel
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
+from carebt.nodeStatus import IDLE_OR_RUNNING
 from carebt.nodeStatus import NodeStatus
 from carebt.rootNode import RootNode
 from carebt.simplePrintLogger import SimplePrintLogger
@@ -24,6 +25,8 @@ from carebt.treeNode import TreeNode
 
 class _RootNode(RootNode):
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner'):
         super().__init__(bt_runner)
 
@@ -139,8 +142,7 @@ class BehaviorTreeRunner:
         self._tick_count = 0
 
         # run tree
-        while(self._instance.get_status() == NodeStatus.IDLE
-                or self._instance.get_status() == NodeStatus.RUNNING):
+        while(self._instance.get_status() in IDLE_OR_RUNNING):
             self._tick_count += 1
             self.get_logger().trace('---------------------------------- '
                                     + f'tick-count: {self._tick_count}')
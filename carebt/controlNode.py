@@ -13,15 +13,22 @@
 # limitations under the License.
 
 from abc import ABC
-from datetime import datetime
+from heapq import merge
 import re
+from time import monotonic_ns
+from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import final
+from typing import Iterable
 from typing import List
+from typing import Tuple
 from typing import TYPE_CHECKING
 
+from carebt.abstractLogger import LogLevel
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
 from carebt.executionContext import ExecutionContext
+from carebt.nodeStatus import IDLE_OR_RUNNING
 from carebt.nodeStatus import NodeStatus
 from carebt.treeNode import TreeNode
 
@@ -29,14 +36,59 @@ if TYPE_CHECKING:
     from carebt.behaviorTreeRunner import BehaviorTreeRunner  # pragma: no cover
 
 
+def _compile_contingency_handler(index: int,
+                                 node,
+                                 node_status_list: Iterable[NodeStatus],
+                                 contingency_message: str,
+                                 function_name: str) -> tuple:
+    # compile the regex only once, as the contingency-handlers are checked every tick;
+    # the statuses are stored as frozenset, sets like FAILURE_ONLY are not copied;
+    # the last entry is the class name the handler is indexed by, None for a regex
+    if(isinstance(node, str)):
+        return (index, re.compile(node), frozenset(node_status_list),
+                re.compile(contingency_message), function_name, None)
+    return (index, re.compile(node.__name__), frozenset(node_status_list),
+            re.compile(contingency_message), function_name, node.__name__)
+
+
 class ControlNode(TreeNode, ABC):
     """The careBT `ControlNode` class.
 
     `ControlNode` is the basic class for all nodes in careBT which provide a
     control flow functionality, like `SequenceNode` and `ParallelNode`.
 
+    Contingency-handlers which are the same for all instances of a node class can
+    be declared in the class attribute `contingency_handlers`. Each entry is a tuple
+    of the `node`, the `node_status_list` and the `contingency_message` as used in
+    `register_contingency_handler` and the name of the handler function. They are
+    compiled once when the class is created and added to each node when it is created,
+    thus before the ones registered in `on_init`.
+
     """
 
+    __slots__ = ('_child_ec_list', '_child_ptr', '_contingency_handler_list',
+                 '_contingency_handler_dict', '_regex_contingency_handler_list',
+                 '_contingency_handler_cache')
+
+    # contingency-handlers declared for all instances of the class
+    contingency_handlers: Tuple[Tuple[Any, Iterable[NodeStatus], str, str], ...] = ()
+    # the declared contingency-handlers compiled once per class
+    _compiled_contingency_handlers: Tuple[tuple, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # check the handler names when the class is created and not when the
+        # contingency occurs for the first time
+        for contingency_handler in cls.contingency_handlers:
+            if(not callable(getattr(cls, contingency_handler[3], None))):
+                raise AttributeError(f'{cls.__name__} declares the contingency-handler '
+                                     + f"'{contingency_handler[3]}', but has no such method")
+        cls._compiled_contingency_handlers = tuple(
+            _compile_contingency_handler(index, node, node_status_list,
+                                         contingency_message, function_name)
+            for index, (node, node_status_list, contingency_message, function_name)
+            in enumerate(cls.contingency_handlers))
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         """Init the `ControlNode` with bt_runner and params."""
         super().__init__(bt_runner, params)
@@ -47,7 +99,18 @@ class ControlNode(TreeNode, ABC):
         # the current child pointer
         self._child_ptr = 0
 
+        # all contingency-handlers in the order they are registered
         self._contingency_handler_list = []
+        # contingency-handlers registered for a node class, indexed by class name
+        self._contingency_handler_dict: Dict[str, list] = {}
+        # contingency-handlers registered with a regex for the node name
+        self._regex_contingency_handler_list = []
+        # contingency-handlers which have to be checked, indexed by class name
+        self._contingency_handler_cache: Dict[str, tuple] = {}
+
+        # add the contingency-handlers declared for the class
+        for contingency_handler in self._compiled_contingency_handlers:
+            self._internal_add_contingency_handler(contingency_handler)
 
         self.set_status(NodeStatus.IDLE)
 
@@ -64,13 +127,14 @@ class ControlNode(TreeNode, ABC):
         # create child nodes
         self._internal_create_child_nodes()
 
-        # _throttle_ms -> tick
+        # _throttle_ns -> tick
         tick: bool = False
-        current_ts = datetime.now()
-        if(self._throttle_ms is None
-           or int((current_ts - self._last_ts).total_seconds() * 1000) >= self._throttle_ms):
-            self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} '
-                                              + f'- {self.get_status()}')
+        current_ts = monotonic_ns()
+        if(self._throttle_ns is None or self._last_ts is None
+           or current_ts - self._last_ts >= self._throttle_ns):
+            logger = self.get_logger()
+            if(logger.is_enabled_for(LogLevel.TRACE)):
+                logger.trace(f'ticking {self.__class__.__name__} - {self.get_status()}')
             tick = True
             self._last_ts = current_ts
 
@@ -95,76 +159,106 @@ class ControlNode(TreeNode, ABC):
         raise NotImplementedError
 
     def _internal_bind_in_params(self, child_ec: ExecutionContext) -> None:
-        if(len(child_ec.call_in_params) != len(child_ec.instance._internal_get_in_params())):
+        instance = child_ec.instance
+        in_attrs = instance._internal_get_in_attrs()
+        if(len(child_ec.call_in_params) != len(in_attrs)):
             self.get_logger().warn(f'{child_ec.node.__name__} takes '
-                                   + f'{len(child_ec.instance._internal_get_in_params())} '
+                                   + f'{len(in_attrs)} '
                                    + f'argument(s), but {len(child_ec.call_in_params)} '
                                    + 'was/were provided')
-        for i, var in enumerate(child_ec.call_in_params):
-            if(isinstance(var, str) and len(var) > 0 and var[0] == '?'):
-                var = var.replace('?', '_', 1)
+        for (is_variable, var), attr in zip(child_ec.call_in_args, in_attrs):
+            if(is_variable):
                 var = getattr(self, var)
-            if(i < len(child_ec.instance._internal_get_in_params())):
-                setattr(child_ec.instance,
-                        child_ec.instance._internal_get_in_params()[i].replace('?', '_', 1), var)
+            setattr(instance, attr, var)
 
     def _internal_bind_out_params(self, child_ec: ExecutionContext) -> None:
-        for i, var in enumerate(child_ec.instance._internal_get_out_params()):
-            var = var.replace('?', '_', 1)
-            if(len(child_ec.call_out_params) > i):
-                if(getattr(child_ec.instance, var) is None):
-                    if(getattr(self,
-                               child_ec.call_out_params[i].replace('?', '_', 1), None) is None):
-                        setattr(self, child_ec.call_out_params[i].replace('?', '_', 1), None)
-                else:
-                    setattr(self, child_ec.call_out_params[i].replace('?', '_', 1),
-                            getattr(child_ec.instance, var))
+        instance = child_ec.instance
+        for attr, call_var in zip(instance._internal_get_out_attrs(), child_ec.call_out_attrs):
+            if(getattr(instance, attr) is None):
+                if(getattr(self, call_var, None) is None):
+                    setattr(self, call_var, None)
+            else:
+                setattr(self, call_var, getattr(instance, attr))
+
+    @final
+    def _internal_delete_child(self, child_ec: ExecutionContext) -> None:
+        # call on_delete and release the child, thus it gets destroyed by gc
+        if(child_ec.instance is not None):
+            child_ec.instance._internal_on_delete()
+            child_ec.instance = None
+
+    @final
+    def _internal_add_contingency_handler(self, contingency_handler: tuple) -> None:
+        self._contingency_handler_list.append(contingency_handler)
+        if(contingency_handler[5] is None):
+            self._regex_contingency_handler_list.append(contingency_handler)
+        else:
+            self._contingency_handler_dict.setdefault(contingency_handler[5], [])\
+                .append(contingency_handler)
+        # invalidate the cache after the handler is added by swapping in a new dict;
+        # handlers might be registered from other threads, thus a tick which is
+        # filling the cache at the same time only stores into the old dict
+        self._contingency_handler_cache = {}
 
     @final
     def _internal_tick_child(self, child_ec: ExecutionContext):
 
         # if child status is IDLE or RUNNING -> tick it
-        if(child_ec.instance.get_status() == NodeStatus.IDLE or
-           child_ec.instance.get_status() == NodeStatus.RUNNING):
+        if(child_ec.instance.get_status() in IDLE_OR_RUNNING):
             # tick child
             child_ec.instance._internal_on_tick()
 
     @final
     def _internal_apply_contingencies(self, child_ec: ExecutionContext):
-        self.get_logger().debug('searching contingency-handler for: '
-                                + f'{child_ec.instance.__class__.__name__} - '
-                                + f'{child_ec.instance.get_status()} - '
-                                + f'{child_ec.instance.get_contingency_message()}')
-
-        # iterate over contingency_handler_list
-        for contingency_handler in self._contingency_handler_list:
-
-            # handle regex
-            if(isinstance(contingency_handler[0], str)):
-                regexClassName = re.compile(contingency_handler[0])
-            else:
-                regexClassName = re.compile(contingency_handler[0].__name__)
-            regexMessage = re.compile(contingency_handler[2])
-
-            self.get_logger().debug(f'checking contingency_handler: {regexClassName.pattern} - '
-                                    + f'{contingency_handler[1]} - {regexMessage.pattern}')
+        # do not keep a reference to the instance, as the contingency-handler
+        # might remove the child and the gc should delete it right away
+        class_name = child_ec.instance.__class__.__name__
+        status = child_ec.instance.get_status()
+        contingency_message = child_ec.instance.get_contingency_message()
+
+        logger = self.get_logger()
+        debug = logger.is_enabled_for(LogLevel.DEBUG)
+
+        if(debug):
+            logger.debug('searching contingency-handler for: '
+                         + f'{class_name} - {status} - {contingency_message}')
+
+        # only the handlers registered for this class and the regex handlers
+        # can match; merge them by registration index to keep the order and
+        # cache the result until the next handler is registered
+        # bind the cache before building the entry, thus an entry which is stale due to
+        # a concurrent registration is stored into the already replaced dict
+        contingency_handler_cache = self._contingency_handler_cache
+        contingency_handlers = contingency_handler_cache.get(class_name)
+        if(contingency_handlers is None):
+            contingency_handlers = tuple(merge(self._contingency_handler_dict.get(class_name, ()),
+                                               self._regex_contingency_handler_list))
+            contingency_handler_cache[class_name] = contingency_handlers
+
+        for contingency_handler in contingency_handlers:
+
+            regexClassName = contingency_handler[1]
+            regexMessage = contingency_handler[3]
+
+            if(debug):
+                logger.debug(f'checking contingency_handler: {regexClassName.pattern} - '
+                             + f'{contingency_handler[2]} - {regexMessage.pattern}')
 
             # check if contingency-handler matches
-            if(bool(re.match(regexClassName,
-                             child_ec.instance.__class__.__name__))
-                    and child_ec.instance.get_status() in contingency_handler[1]
-                    and bool(re.match(regexMessage,
-                                      child_ec.instance.get_contingency_message()))):
-                self.get_logger().debug(f'{child_ec.instance.__class__.__name__} -> '
-                                        + f'run contingency_handler {contingency_handler[3]}')
+            if(regexClassName.fullmatch(class_name) is not None
+                    and status in contingency_handler[2]
+                    and regexMessage.fullmatch(contingency_message) is not None):
+                if(debug):
+                    logger.debug(f'{class_name} -> '
+                                 + f'run contingency_handler {contingency_handler[4]}')
                 # append ContingencyHistoryEntry to history
                 self._internal_append_to_contingency_history(
-                    ContingencyHistoryEntry(child_ec.instance.__class__.__name__,
-                                            child_ec.instance.get_status(),
-                                            child_ec.instance.get_contingency_message(),
-                                            contingency_handler[3]))
+                    ContingencyHistoryEntry(class_name,
+                                            status,
+                                            contingency_message,
+                                            contingency_handler[4]))
                 # execute function attached to the contingency-handler
-                exec(f'self.{contingency_handler[3]}()')
+                getattr(self, contingency_handler[4])()
                 break
 
     # PUBLIC
@@ -172,7 +266,7 @@ class ControlNode(TreeNode, ABC):
     @final
     def register_contingency_handler(self,
                                      node,
-                                     node_status_list: List[NodeStatus],
+                                     node_status_list: Iterable[NodeStatus],
                                      contingency_message: str,
                                      contingency_function: Callable) -> None:
         """Register a contingency-handler.
@@ -182,15 +276,16 @@ class ControlNode(TreeNode, ABC):
         status and contingency message in the order they are registered.
 
         For the parameters `node` and `contingency_message` a regular expression (regex)
-        can be used.
+        can be used. The regex has to match the whole name, respectively message.
 
         Parameters
         ----------
         node: TreeNode, str
             The node the contingency-handler triggers on. In case of using regex
             the name has to be provided as string.
-        node_status_list:  [NodeStatus]
-            A list of NodeStatuses the contingency-handler triggers on.
+        node_status_list:  Iterable[NodeStatus]
+            The NodeStatuses the contingency-handler triggers on, e.g. a list or one
+            of the sets defined in `carebt.nodeStatus`, like `FAILURE_ONLY`.
         contingency_message: str
             A regex the contingency-message has to match.
         contingency_function: Callable
@@ -199,10 +294,12 @@ class ControlNode(TreeNode, ABC):
         """
         # for the function only store the name, thus there is no 'bound method' to self
         # which increases the ref count and prevents the gc to delete the object
-        self._contingency_handler_list.append((node,
-                                               node_status_list,
-                                               contingency_message,
-                                               contingency_function.__name__))
+        self._internal_add_contingency_handler(
+            _compile_contingency_handler(len(self._contingency_handler_list),
+                                         node,
+                                         node_status_list,
+                                         contingency_message,
+                                         contingency_function.__name__))
 
     @final
     def fix_current_child(self) -> None:
@@ -12,40 +12,59 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
 from carebt.treeNode import TreeNode
 
 
+# bounded, as the params strings might be created dynamically
+@lru_cache(maxsize=1024)
+def _compile_params(params: str) -> Tuple[tuple, tuple]:
+    # the same params strings are used whenever a child is added, thus split
+    # them only once and compile the input params which are no careBt variables
+    _params = params.split('=>')
+    call_in_params = []
+    for p in _params[0].split():
+        # param is a careBt variable (starts with ?)
+        if(p[0] == '?'):
+            call_in_params.append(p)
+        else:
+            try:
+                # param is a member variable of the parent
+                call_in_params.append(compile(f'parent.{p}', '<params>', 'eval'))
+            except SyntaxError:
+                # param is a value
+                call_in_params.append(compile(p, '<params>', 'eval'))
+
+    # extract call output params if available
+    call_out_params = ()
+    if(len(_params) == 2):
+        call_out_params = tuple(_params[1].split())
+    return tuple(call_in_params), call_out_params
+
+
 class ExecutionContext():
 
     def __init__(self, parent: TreeNode, node: TreeNode, params: str):
-        self.call_in_params: List[str] = []
-        self.call_out_params: List[str] = []
+        self.call_in_params: Tuple = ()
+        self.call_out_params: Tuple[str, ...] = ()
 
         if(params is not None):
-            params = params.replace('   ', ' ')
-            params = params.replace('  ',  ' ')
-
-            # extract call input params if available
-            for p in filter(None, params.split('=>')[0].split(' ')):
-                # param is a careBt variable (starts with ?)
-                if(p[0] == '?'):
-                    self.call_in_params.append(p)
-                else:
-                    try:
-                        # param is a member variable of the parent
-                        self.call_in_params.append(eval(f'parent.{p}'))
-                    except SyntaxError:
-                        # param is a value
-                        self.call_in_params.append(eval(p))
-            self.call_in_params = tuple(self.call_in_params)
-
-            # extract call output params if available
-            if(len(params.split('=>')) == 2):
-                for p in filter(None, params.split('=>')[1].split(' ')):
-                    self.call_out_params.append(p)
-                self.call_out_params = tuple(self.call_out_params)
+            call_in_params, self.call_out_params = _compile_params(params)
+            # evaluate the params, as member variables of the parent might change
+            self.call_in_params = tuple(p if isinstance(p, str)
+                                        else eval(p, globals(), {'parent': parent})
+                                        for p in call_in_params)
+
+        # classify the call params once, thus binding them is a plain
+        # getattr/setattr; the careBT variables (?x) are resolved to the
+        # names of the member variables (_x) of the parent
+        self.call_in_args = tuple((True, var.replace('?', '_', 1))
+                                  if(isinstance(var, str) and len(var) > 0 and var[0] == '?')
+                                  else (False, var)
+                                  for var in self.call_in_params)
+        self.call_out_attrs = tuple(var.replace('?', '_', 1) for var in self.call_out_params)
 
         # the node
         self.node = node
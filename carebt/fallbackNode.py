@@ -18,7 +18,11 @@ from typing import TYPE_CHECKING
 
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
+from carebt.nodeStatus import COMPLETED
+from carebt.nodeStatus import FAILURE_OR_ABORTED
 from carebt.nodeStatus import NodeStatus
+from carebt.nodeStatus import RUNNING_OR_SUSPENDED
+from carebt.nodeStatus import SUCCESS_OR_FIXED
 from carebt.treeNode import TreeNode
 
 if TYPE_CHECKING:
@@ -47,6 +51,8 @@ class FallbackNode(ControlNode, ABC):
 
     """
 
+    __slots__ = ('_contingency_message',)
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         """Init the `FallbackNode` with bt_runner and params."""
         super().__init__(bt_runner, params)
@@ -75,21 +81,16 @@ class FallbackNode(ControlNode, ABC):
                 cur_child_state = self._child_ec_list[self._child_ptr].instance.get_status()
 
                 # if the current child tick returned with SUCCESS or FIXED
-                if(cur_child_state == NodeStatus.SUCCESS
-                   or cur_child_state == NodeStatus.FIXED):
+                if(cur_child_state in SUCCESS_OR_FIXED):
                     self.set_status(cur_child_state)
                     self.set_contingency_message(self._child_ec_list[self._child_ptr]
                                                  .instance.get_contingency_message())
 
-                cur_child_state = self._child_ec_list[self._child_ptr].instance.get_status()
                 # if the current child tick returned with FAILURE or ABORTED
-                if(cur_child_state == NodeStatus.FAILURE
-                   or cur_child_state == NodeStatus.ABORTED):
+                elif(cur_child_state in FAILURE_OR_ABORTED):
                     self._contingency_message = self._child_ec_list[self._child_ptr]\
                         .instance.get_contingency_message()
-                    if(self._child_ec_list[self._child_ptr].instance is not None):
-                        self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-                        self._child_ec_list[self._child_ptr].instance = None
+                    self._internal_delete_child(self._child_ec_list[self._child_ptr])
                     # check if there is at least one more node to run
                     if(self._child_ptr + 1 < len(self._child_ec_list)):
                         self._child_ptr += 1
@@ -98,14 +99,9 @@ class FallbackNode(ControlNode, ABC):
                         self.set_status(cur_child_state)
                         self.set_contingency_message(self._contingency_message)
 
-        if(self.get_status() == NodeStatus.SUCCESS
-           or self.get_status() == NodeStatus.FAILURE
-           or self.get_status() == NodeStatus.ABORTED
-           or self.get_status() == NodeStatus.FIXED):
+        if(self.get_status() in COMPLETED):
             self.get_logger().info(f'finished {self.__class__.__name__}')
-            if(self._child_ec_list[self._child_ptr].instance is not None):
-                self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-                self._child_ec_list[self._child_ptr].instance = None
+            self._internal_delete_child(self._child_ec_list[self._child_ptr])
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
@@ -115,13 +111,10 @@ class FallbackNode(ControlNode, ABC):
             self.set_contingency_message(self._child_ec_list[self._child_ptr]
                                          .instance.get_contingency_message())
         # abort current child if RUNNING or SUSPENDED
-        if(self._child_ec_list[self._child_ptr].instance.get_status() == NodeStatus.RUNNING or
-           self._child_ec_list[self._child_ptr].instance.get_status() == NodeStatus.SUSPENDED):
+        if(self._child_ec_list[self._child_ptr].instance.get_status() in RUNNING_OR_SUSPENDED):
             self._child_ec_list[self._child_ptr].instance._internal_on_abort()
 
-        if(self._child_ec_list[self._child_ptr].instance is not None):
-            self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-            self._child_ec_list[self._child_ptr].instance = None
+        self._internal_delete_child(self._child_ec_list[self._child_ptr])
         self.on_abort()
 
     # PUBLIC
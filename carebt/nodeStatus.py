@@ -12,29 +12,69 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from enum import Enum
+from enum import Flag
+from enum import IntFlag
 
 
-class NodeStatus(Enum):
-    """An Enum representing the status of a careBT node."""
+class NodeStatus(IntFlag):
+    """An Enum representing the status of a careBT node.
 
-    IDLE = 0
+    The statuses are int flags, thus comparing them and hashing them, e.g. when
+    checking if a status is in a set of statuses, are plain int operations.
+    """
+
+    IDLE = 1
     """Node is waiting for first execution"""
 
-    RUNNING = 1
+    RUNNING = 2
     """Node is currently executing"""
 
-    SUSPENDED = 2
+    SUSPENDED = 4
     """Node is currently executing, but on_tick() is not called"""
 
-    SUCCESS = 3
+    SUCCESS = 8
     """Node has completed with SUCCESS"""
 
-    FAILURE = 4
+    FAILURE = 16
     """Node has completed with FAILURE"""
 
-    ABORTED = 5
+    ABORTED = 32
     """Node has completed with ABORTED"""
 
-    FIXED = 6
+    FIXED = 64
     """Node has completed with FIXED (by contingency-handler)"""
+
+    # keep the string representation of a plain Enum, e.g. 'NodeStatus.SUCCESS'
+    __str__ = Flag.__str__
+
+    def __format__(self, format_spec):
+        return str(self).__format__(format_spec)
+
+
+# Sets of `NodeStatus` which are checked together by the careBT nodes.
+
+IDLE_OR_RUNNING = frozenset({NodeStatus.IDLE, NodeStatus.RUNNING})
+"""Node is ticked"""
+
+RUNNING_OR_SUSPENDED = frozenset({NodeStatus.RUNNING, NodeStatus.SUSPENDED})
+"""Node is currently executing"""
+
+IDLE_RUNNING_OR_SUSPENDED = frozenset({NodeStatus.IDLE, NodeStatus.RUNNING,
+                                       NodeStatus.SUSPENDED})
+"""Node has not completed yet"""
+
+SUCCESS_OR_FIXED = frozenset({NodeStatus.SUCCESS, NodeStatus.FIXED})
+"""Node has completed successfully"""
+
+FAILURE_OR_ABORTED = frozenset({NodeStatus.FAILURE, NodeStatus.ABORTED})
+"""Node has completed unsuccessfully"""
+
+SUCCESS_OR_FAILURE = frozenset({NodeStatus.SUCCESS, NodeStatus.FAILURE})
+"""Node has completed with SUCCESS or FAILURE"""
+
+COMPLETED = frozenset({NodeStatus.SUCCESS, NodeStatus.FAILURE,
+                       NodeStatus.ABORTED, NodeStatus.FIXED})
+"""Node has completed"""
+
+FAILURE_ONLY = frozenset({NodeStatus.FAILURE})
+"""Node has completed with FAILURE, e.g. to register a contingency-handler"""
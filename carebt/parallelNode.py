@@ -14,11 +14,17 @@
 
 from abc import ABC
 from typing import List
+from typing import Tuple
 
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
+from carebt.nodeStatus import FAILURE_OR_ABORTED
+from carebt.nodeStatus import IDLE_RUNNING_OR_SUSPENDED
 from carebt.nodeStatus import NodeStatus
+from carebt.nodeStatus import RUNNING_OR_SUSPENDED
+from carebt.nodeStatus import SUCCESS_OR_FAILURE
+from carebt.nodeStatus import SUCCESS_OR_FIXED
 from carebt.treeNode import TreeNode
 
 
@@ -36,7 +42,9 @@ class ParallelNode(ControlNode, ABC):
 
     The `ParallelNode` forwards the ticks to all children in a quasi-parallel manner. If
     the `ParallelNode` gets ticked, it ticks the children in the order they were added - but
-    within the same received tick.
+    within the same received tick. As soon as the `success_threshold` is reached, or can not
+    be reached anymore, the remaining children are not ticked in this tick. Instead, the ones
+    which are `RUNNING` or `SUSPENDED` are aborted and all of them are deleted.
 
     Parameters
     ----------
@@ -51,6 +59,9 @@ class ParallelNode(ControlNode, ABC):
 
     """
 
+    __slots__ = ('_created_child_size', '_success_threshold', '_success_count', '_fail_count',
+                 '__last_child_contingency_msg')
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner',
                  success_threshold: int, params: str = None):
         """Init the `ParallelNode` with bt_runner, success_threshold and params."""
@@ -70,9 +81,7 @@ class ParallelNode(ControlNode, ABC):
     # PROTECTED
 
     def _internal_create_child_nodes(self) -> None:
-        if((self.get_status() == NodeStatus.IDLE
-            or self.get_status() == NodeStatus.RUNNING
-            or self.get_status() == NodeStatus.SUSPENDED)
+        if(self.get_status() in IDLE_RUNNING_OR_SUSPENDED
            and self._created_child_size < len(self._child_ec_list)):
             for _ in range(len(self._child_ec_list) - self._created_child_size):
                 child_ec = self._child_ec_list[self._created_child_size]
@@ -93,18 +102,18 @@ class ParallelNode(ControlNode, ABC):
                     if(child_ec.instance is not None):
                         self._internal_bind_out_params(child_ec)
                         cur_child_state = child_ec.instance.get_status()
-                        if(cur_child_state == NodeStatus.SUCCESS
-                           or cur_child_state == NodeStatus.FIXED):
-                            child_ec.instance._internal_on_delete()
-                            child_ec.instance = None
+                        if(cur_child_state in SUCCESS_OR_FIXED):
+                            self._internal_delete_child(child_ec)
                             self._success_count += 1
-                        elif(cur_child_state == NodeStatus.FAILURE
-                             or cur_child_state == NodeStatus.ABORTED):
+                        elif(cur_child_state in FAILURE_OR_ABORTED):
                             self.__last_child_contingency_msg = child_ec.instance\
                                                                 .get_contingency_message()
-                            child_ec.instance._internal_on_delete()
-                            child_ec.instance = None
+                            self._internal_delete_child(child_ec)
                             self._fail_count += 1
+                    # stop ticking the remaining children if the result is decided
+                    if(self._success_count >= self._success_threshold
+                       or self._fail_count > len(self._child_ec_list) - self._success_threshold):
+                        break
 
     def _internal_prepare_next_tick(self) -> None:
         if(self.get_status() != NodeStatus.ABORTED):
@@ -121,16 +130,15 @@ class ParallelNode(ControlNode, ABC):
                 self.set_status(NodeStatus.FAILURE)
                 self.set_contingency_message(self.__last_child_contingency_msg)
 
-            if(self.get_status() == NodeStatus.SUCCESS
-               or self.get_status() == NodeStatus.FAILURE):
-                # abort children if RUNNING or SUSPENDED
+            if(self.get_status() in SUCCESS_OR_FAILURE):
+                # abort children if RUNNING or SUSPENDED and delete all remaining
+                # children, as the children after the deciding one were not ticked
+                # anymore and might still be IDLE or completed asynchronously
                 for child_ec in self._child_ec_list:
-                    if(child_ec.instance is not None and
-                       (child_ec.instance.get_status() == NodeStatus.RUNNING or
-                            child_ec.instance.get_status() == NodeStatus.SUSPENDED)):
-                        child_ec.instance._internal_on_abort()
-                        child_ec.instance._internal_on_delete()
-                        child_ec.instance = None
+                    if(child_ec.instance is not None):
+                        if(child_ec.instance.get_status() in RUNNING_OR_SUSPENDED):
+                            child_ec.instance._internal_on_abort()
+                        self._internal_delete_child(child_ec)
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
@@ -141,12 +149,10 @@ class ParallelNode(ControlNode, ABC):
                                          .instance.get_contingency_message())
         # abort children if RUNNING or SUSPENDED
         for child_ec in self._child_ec_list:
-            if(child_ec.instance is not None and
-               (child_ec.instance.get_status() == NodeStatus.RUNNING or
-                    child_ec.instance.get_status() == NodeStatus.SUSPENDED)):
+            if(child_ec.instance is not None
+               and child_ec.instance.get_status() in RUNNING_OR_SUSPENDED):
                 child_ec.instance._internal_on_abort()
-                child_ec.instance._internal_on_delete()
-                child_ec.instance = None
+                self._internal_delete_child(child_ec)
         self.on_abort()
 
     # PUBLIC
@@ -188,6 +194,21 @@ class ParallelNode(ControlNode, ABC):
         """
         self._child_ec_list.append(ExecutionContext(self, node, params))
 
+    def add_children(self, children: List[Tuple[TreeNode, str]]) -> None:
+        """Add several child nodes.
+
+        Add the child nodes in the provided order, which is the same as calling
+        `add_child` for each of them.
+
+        Parameters
+        ----------
+        children: [(TreeNode, str)]
+            The nodes to be added together with their parameters
+
+        """
+        self._child_ec_list.extend(ExecutionContext(self, node, params)
+                                   for node, params in children)
+
     def remove_child(self, pos: int) -> None:
         """Remove a child node.
 
@@ -203,8 +224,7 @@ class ParallelNode(ControlNode, ABC):
         self._created_child_size -= 1
         if(self._child_ec_list[pos].instance is not None):
             self._child_ec_list[pos].instance._internal_on_abort()
-            self._child_ec_list[pos].instance._internal_on_delete()
-            self._child_ec_list[pos].instance = None
+            self._internal_delete_child(self._child_ec_list[pos])
         del self._child_ec_list[pos]
 
     def remove_all_children(self) -> None:
@@ -212,5 +232,11 @@ class ParallelNode(ControlNode, ABC):
         self._success_count = 0
         self._fail_count = 0
 
-        for _ in range(self._created_child_size):
-            self.remove_child(0)
+        # abort and delete the created children and remove them all at once,
+        # as removing them one by one from the head of the list is O(n^2)
+        for child_ec in self._child_ec_list[:self._created_child_size]:
+            if(child_ec.instance is not None):
+                child_ec.instance._internal_on_abort()
+                self._internal_delete_child(child_ec)
+        del self._child_ec_list[:self._created_child_size]
+        self._created_child_size = 0
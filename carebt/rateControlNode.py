@@ -17,7 +17,11 @@ from typing import TYPE_CHECKING
 
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
+from carebt.nodeStatus import COMPLETED
+from carebt.nodeStatus import FAILURE_OR_ABORTED
 from carebt.nodeStatus import NodeStatus
+from carebt.nodeStatus import RUNNING_OR_SUSPENDED
+from carebt.nodeStatus import SUCCESS_OR_FIXED
 from carebt.treeNode import TreeNode
 
 if TYPE_CHECKING:
@@ -47,12 +51,14 @@ class RateControlNode(ControlNode, ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', throttle_ms: int, params: str = None):
         """Init the `ActionNode` with bt_runner,rate_ms and params."""
         super().__init__(bt_runner, params)
         self.get_logger().info(f'creating {self.__class__.__name__}')
 
-        self._throttle_ms = throttle_ms
+        self.set_throttle_ms(throttle_ms)
         self.set_status(NodeStatus.IDLE)
 
     # PROTECTED
@@ -77,15 +83,13 @@ class RateControlNode(ControlNode, ABC):
             cur_child_state = self._child_ec_list[0].instance.get_status()
 
             # if the current child tick returned with FAILURE or ABORTED
-            if(cur_child_state == NodeStatus.FAILURE or
-                    cur_child_state == NodeStatus.ABORTED):
+            if(cur_child_state in FAILURE_OR_ABORTED):
                 self.set_status(cur_child_state)
                 self.set_contingency_message(self._child_ec_list[0]
                                              .instance.get_contingency_message())
 
             # if the current child tick returned with SUCCESS or FIXED
-            elif(cur_child_state == NodeStatus.SUCCESS
-                 or cur_child_state == NodeStatus.FIXED):
+            elif(cur_child_state in SUCCESS_OR_FIXED):
                 # if current child state is FIXED -> do not bind out_params
                 # as the 'fix' implementation is done in the contingency-handler
                 if(cur_child_state != NodeStatus.FIXED):
@@ -94,13 +98,9 @@ class RateControlNode(ControlNode, ABC):
                 self.set_contingency_message(self._child_ec_list[0]
                                              .instance.get_contingency_message())
 
-        if(self.get_status() == NodeStatus.SUCCESS
-           or self.get_status() == NodeStatus.FAILURE
-           or self.get_status() == NodeStatus.ABORTED
-           or self.get_status() == NodeStatus.FIXED):
+        if(self.get_status() in COMPLETED):
             self.get_logger().info(f'finished {self.__class__.__name__}')
-            self._child_ec_list[0].instance._internal_on_delete()
-            self._child_ec_list[0].instance = None
+            self._internal_delete_child(self._child_ec_list[0])
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
@@ -110,13 +110,10 @@ class RateControlNode(ControlNode, ABC):
             self.set_contingency_message(self._child_ec_list[self._child_ptr]
                                          .instance.get_contingency_message())
         # abort child if RUNNING or SUSPENDED
-        if(self._child_ec_list[0].instance.get_status() == NodeStatus.RUNNING or
-           self._child_ec_list[0].instance.get_status() == NodeStatus.SUSPENDED):
+        if(self._child_ec_list[0].instance.get_status() in RUNNING_OR_SUSPENDED):
             self._child_ec_list[0].instance._internal_on_abort()
 
-        if(self._child_ec_list[0].instance is not None):
-            self._child_ec_list[0].instance._internal_on_delete()
-            self._child_ec_list[0].instance = None
+        self._internal_delete_child(self._child_ec_list[0])
         self.on_abort()
 
     # PUBLIC
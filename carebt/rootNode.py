@@ -18,7 +18,10 @@ from typing import TYPE_CHECKING
 
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
+from carebt.nodeStatus import COMPLETED
+from carebt.nodeStatus import FAILURE_OR_ABORTED
 from carebt.nodeStatus import NodeStatus
+from carebt.nodeStatus import SUCCESS_OR_FIXED
 from carebt.treeNode import TreeNode
 
 if TYPE_CHECKING:
@@ -27,6 +30,8 @@ if TYPE_CHECKING:
 
 class RootNode(ControlNode, ABC):
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         super().__init__(bt_runner, params)
 
@@ -52,15 +57,13 @@ class RootNode(ControlNode, ABC):
             cur_child_state = self._child_ec_list[0].instance.get_status()
 
             # if the current child tick returned with FAILURE or ABORTED
-            if(cur_child_state == NodeStatus.FAILURE or
-                    cur_child_state == NodeStatus.ABORTED):
+            if(cur_child_state in FAILURE_OR_ABORTED):
                 self.set_status(cur_child_state)
                 self.set_contingency_message(self._child_ec_list[0]
                                              .instance.get_contingency_message())
 
             # if the current child tick returned with SUCCESS or FIXED
-            elif(cur_child_state == NodeStatus.SUCCESS
-                 or cur_child_state == NodeStatus.FIXED):
+            elif(cur_child_state in SUCCESS_OR_FIXED):
                 # if current child state is FIXED -> do not bind out_params
                 # as the 'fix' implementation is done in the contingency-handler
                 if(cur_child_state != NodeStatus.FIXED):
@@ -69,10 +72,7 @@ class RootNode(ControlNode, ABC):
                 self.set_contingency_message(self._child_ec_list[0]
                                              .instance.get_contingency_message())
 
-        if(self.get_status() == NodeStatus.SUCCESS
-           or self.get_status() == NodeStatus.FAILURE
-           or self.get_status() == NodeStatus.ABORTED
-           or self.get_status() == NodeStatus.FIXED):
+        if(self.get_status() in COMPLETED):
             self._child_ec_list[0].instance._internal_on_delete()
             # forward status and contingency-message to RootNode
             self.set_status(self._child_ec_list[0].instance.get_status())
@@ -18,7 +18,11 @@ from typing import TYPE_CHECKING
 
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
+from carebt.nodeStatus import COMPLETED
+from carebt.nodeStatus import FAILURE_OR_ABORTED
 from carebt.nodeStatus import NodeStatus
+from carebt.nodeStatus import RUNNING_OR_SUSPENDED
+from carebt.nodeStatus import SUCCESS_OR_FIXED
 from carebt.treeNode import TreeNode
 
 if TYPE_CHECKING:
@@ -51,6 +55,8 @@ class SequenceNode(ControlNode, ABC):
 
     """
 
+    __slots__ = ('_contingency_message',)
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         """Init the `SequenceNode` with bt_runner and params."""
         super().__init__(bt_runner, params)
@@ -59,45 +65,40 @@ class SequenceNode(ControlNode, ABC):
     # PROTECTED
 
     def _internal_create_child_nodes(self) -> None:
-        if(self._child_ec_list[self._child_ptr].instance is None):
+        cur_child_ec = self._child_ec_list[self._child_ptr]
+        if(cur_child_ec.instance is None):
             # create node instance
-            self._child_ec_list[self._child_ptr].instance = \
-                self._child_ec_list[self._child_ptr].node(self._internal_get_bt_runner())
-            self._internal_bind_in_params(self._child_ec_list[self._child_ptr])
-            self._child_ec_list[self._child_ptr].instance.on_init()
+            cur_child_ec.instance = cur_child_ec.node(self._internal_get_bt_runner())
+            self._internal_bind_in_params(cur_child_ec)
+            cur_child_ec.instance.on_init()
 
     def _internal_tick_child_nodes(self, tick: bool) -> None:
+        cur_child_ec = self._child_ec_list[self._child_ptr]
         if(tick is True):
-            self._internal_tick_child(self._child_ec_list[self._child_ptr])
+            self._internal_tick_child(cur_child_ec)
 
-        self._internal_bind_out_params(self._child_ec_list[self._child_ptr])
-        self._internal_apply_contingencies(self._child_ec_list[self._child_ptr])
+        self._internal_bind_out_params(cur_child_ec)
+        self._internal_apply_contingencies(cur_child_ec)
 
     def _internal_prepare_next_tick(self) -> None:
         if(self.get_status() == NodeStatus.RUNNING):
-            if self._child_ec_list[self._child_ptr].instance is not None:
-                cur_child_state = self._child_ec_list[self._child_ptr].instance.get_status()
+            cur_child_ec = self._child_ec_list[self._child_ptr]
+            if cur_child_ec.instance is not None:
+                cur_child_state = cur_child_ec.instance.get_status()
 
                 # if the current child tick returned with FAILURE or ABORTED
-                if(cur_child_state == NodeStatus.FAILURE
-                   or cur_child_state == NodeStatus.ABORTED):
+                if(cur_child_state in FAILURE_OR_ABORTED):
                     self.set_status(cur_child_state)
-                    self.set_contingency_message(self._child_ec_list[self._child_ptr]
-                                                 .instance.get_contingency_message())
+                    self.set_contingency_message(cur_child_ec.instance.get_contingency_message())
 
-                cur_child_state = self._child_ec_list[self._child_ptr].instance.get_status()
                 # if the current child tick returned with SUCCESS or FIXED
-                if(cur_child_state == NodeStatus.SUCCESS
-                   or cur_child_state == NodeStatus.FIXED):
-                    self._contingency_message = self._child_ec_list[self._child_ptr]\
-                        .instance.get_contingency_message()
+                elif(cur_child_state in SUCCESS_OR_FIXED):
+                    self._contingency_message = cur_child_ec.instance.get_contingency_message()
                     # if current child state is FIXED -> do not bind out_params
                     # as the 'fix' implementation is done in the contingency-handler
                     if(cur_child_state != NodeStatus.FIXED):
-                        self._internal_bind_out_params(self._child_ec_list[self._child_ptr])
-                    if(self._child_ec_list[self._child_ptr].instance is not None):
-                        self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-                        self._child_ec_list[self._child_ptr].instance = None
+                        self._internal_bind_out_params(cur_child_ec)
+                    self._internal_delete_child(cur_child_ec)
                     # check if there is at least one more node to run
                     if(self._child_ptr + 1 < len(self._child_ec_list)):
                         self._child_ptr += 1
@@ -106,30 +107,22 @@ class SequenceNode(ControlNode, ABC):
                         self.set_status(NodeStatus.SUCCESS)
                         self.set_contingency_message(self._contingency_message)
 
-        if(self.get_status() == NodeStatus.SUCCESS
-           or self.get_status() == NodeStatus.FAILURE
-           or self.get_status() == NodeStatus.ABORTED
-           or self.get_status() == NodeStatus.FIXED):
+        if(self.get_status() in COMPLETED):
             self.get_logger().info(f'finished {self.__class__.__name__}')
-            if(self._child_ec_list[self._child_ptr].instance is not None):
-                self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-                self._child_ec_list[self._child_ptr].instance = None
+            self._internal_delete_child(self._child_ec_list[self._child_ptr])
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
         self.get_logger().info(f'aborting {self.__class__.__name__}')
-        if(self._child_ec_list[self._child_ptr].instance is not None):
+        cur_child_ec = self._child_ec_list[self._child_ptr]
+        if(cur_child_ec.instance is not None):
             self.set_status(NodeStatus.ABORTED)
-            self.set_contingency_message(self._child_ec_list[self._child_ptr]
-                                         .instance.get_contingency_message())
+            self.set_contingency_message(cur_child_ec.instance.get_contingency_message())
         # abort current child if RUNNING or SUSPENDED
-        if(self._child_ec_list[self._child_ptr].instance.get_status() == NodeStatus.RUNNING or
-           self._child_ec_list[self._child_ptr].instance.get_status() == NodeStatus.SUSPENDED):
-            self._child_ec_list[self._child_ptr].instance._internal_on_abort()
+        if(cur_child_ec.instance.get_status() in RUNNING_OR_SUSPENDED):
+            cur_child_ec.instance._internal_on_abort()
 
-        if(self._child_ec_list[self._child_ptr].instance is not None):
-            self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-            self._child_ec_list[self._child_ptr].instance = None
+        self._internal_delete_child(cur_child_ec)
         self.on_abort()
 
     # PUBLIC
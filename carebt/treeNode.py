@@ -14,20 +14,131 @@
 
 from abc import ABC
 from abc import abstractmethod
-from datetime import datetime
-from threading import Timer
+from functools import lru_cache
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from itertools import count
+from sys import exc_info
+import threading
+from threading import Condition
+from threading import Thread
+from time import monotonic_ns
+from typing import Callable
 from typing import final
 from typing import List
+from typing import Tuple
 from typing import TYPE_CHECKING
+from weakref import WeakMethod
 
+from carebt.abstractLogger import LogLevel
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
+from carebt.nodeStatus import COMPLETED
 from carebt.nodeStatus import NodeStatus
+from carebt.nodeStatus import RUNNING_OR_SUSPENDED
 
 if TYPE_CHECKING:
     from carebt.behaviorTreeRunner import BehaviorTreeRunner  # pragma: no cover
     from carebt.abstractLogger import AbstractLogger  # pragma: no cover
 
 
+class _TimeoutScheduler():
+    """Call the timeout callbacks of all nodes from one shared thread.
+
+    Instead of starting a `threading.Timer` thread for each timeout, the
+    timeouts are kept in a heap ordered by their deadline. The callbacks are
+    only referenced weakly, thus a pending timeout does not keep a node alive.
+    """
+
+    def __init__(self):
+        self.__condition = Condition()
+        self.__heap = []
+        self.__pending = set()
+        # number of canceled timeouts which are still in the heap
+        self.__canceled = 0
+        self.__ids = count()
+        self.__thread = None
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                while True:
+                    if(len(self.__heap) == 0):
+                        self.__condition.wait()
+                        continue
+                    deadline, timeout_id, callback = self.__heap[0]
+                    # drop canceled timeouts
+                    if(timeout_id not in self.__pending):
+                        heappop(self.__heap)
+                        self.__canceled -= 1
+                        continue
+                    remaining_ns = deadline - monotonic_ns()
+                    if(remaining_ns > 0):
+                        self.__condition.wait(remaining_ns / 1_000_000_000)
+                        continue
+                    heappop(self.__heap)
+                    self.__pending.discard(timeout_id)
+                    break
+            # call the callback without holding the lock, as it might
+            # set or cancel timeouts itself
+            callback = callback()
+            if(callback is not None):
+                try:
+                    callback()
+                except Exception:
+                    # report the error, but keep the thread running for the
+                    # other timeouts
+                    threading.excepthook(threading.ExceptHookArgs(
+                        [*exc_info(), threading.current_thread()]))
+            callback = None
+
+    def schedule(self, timeout_ms: int, callback: Callable) -> int:
+        """Schedule the bound method `callback` and return the id of the timeout."""
+        with self.__condition:
+            timeout_id = next(self.__ids)
+            heappush(self.__heap, (monotonic_ns() + int(timeout_ms * 1_000_000),
+                                   timeout_id,
+                                   WeakMethod(callback)))
+            self.__pending.add(timeout_id)
+            if(self.__thread is None or not self.__thread.is_alive()):
+                self.__thread = Thread(target=self.__run, name='carebt-timeouts', daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+        return timeout_id
+
+    def cancel(self, timeout_id: int) -> None:
+        """Cancel the timeout with the provided id."""
+        with self.__condition:
+            if(timeout_id in self.__pending):
+                self.__pending.remove(timeout_id)
+                self.__canceled += 1
+                # drop the canceled timeouts once they are the majority of the heap,
+                # thus nodes which set long timeouts again and again do not pile them up
+                if(self.__canceled > 32 and 2 * self.__canceled > len(self.__heap)):
+                    self.__heap = [t for t in self.__heap if t[1] in self.__pending]
+                    heapify(self.__heap)
+                    self.__canceled = 0
+
+
+_timeout_scheduler = _TimeoutScheduler()
+
+
+# bounded, as the params strings might be created dynamically
+@lru_cache(maxsize=1024)
+def _parse_params(params: str) -> Tuple[tuple, tuple, tuple, tuple]:
+    # the params of a node class are typically the same for all its instances,
+    # thus parse them only once; returns the in and out params, and the names
+    # of their member variables (e.g. ?x -> _x)
+    out_params = ()
+    _params = params.split('=>')
+    in_params = tuple(_params[0].split())
+    if len(_params) == 2:
+        out_params = tuple(_params[1].split())
+    in_attrs = tuple(p.replace('?', '_', 1) for p in in_params)
+    out_attrs = tuple(p.replace('?', '_', 1) for p in out_params)
+    return in_params, out_params, in_attrs, out_attrs
+
+
 class TreeNode(ABC):
     """The careBT `TreeNode` class.
 
@@ -35,51 +146,60 @@ class TreeNode(ABC):
     for all careBT nodes.
     """
 
+    # the in/out params of the nodes are created dynamically, thus keep a
+    # '__dict__' for them; the members of the node itself are stored in slots
+    __slots__ = ('bt_runner', '_throttle_ns', '_last_ts',
+                 '__node_status', '__contingency_message', '__contingency_history',
+                 '__params', '__in_attrs', '__out_attrs',
+                 '__timeout_timer', '__dict__', '__weakref__')
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         self.bt_runner = bt_runner
         # PROTECTED
-        self._throttle_ms = None
-        self._last_ts = datetime.min
+        # throttle rate and timestamp of the last tick in nanoseconds
+        # (time.monotonic_ns), None means not throttled / not yet ticked
+        self._throttle_ns = None
+        self._last_ts = None
 
         # PRIVATE
         self.__node_status = NodeStatus.IDLE
         self.__contingency_message = ''
         self.__contingency_history: List[ContingencyHistoryEntry] = []
         self.__params = params
-        self.__in_params: List[str] = []
-        self.__out_params: List[str] = []
+        self.__in_attrs: Tuple[str, ...] = ()
+        self.__out_attrs: Tuple[str, ...] = ()
         self.__timeout_timer = None
 
         # create local variables
         if(self.__params is not None):
-            _params = self.__params.split('=>')
-            if(len(_params[0]) > 0):
-                self.__in_params = _params[0].strip().split(' ')
-            if len(_params) == 2:
-                self.__out_params = _params[1].strip().split(' ')
+            (in_params, out_params,
+             self.__in_attrs, self.__out_attrs) = _parse_params(self.__params)
+
+            logger = self.get_logger()
+            trace = logger.is_enabled_for(LogLevel.TRACE)
 
-            self.get_logger().trace(f'{self.__class__.__name__} in_params:  {self.__in_params}')
-            self.get_logger().trace(f'{self.__class__.__name__} out_params: {self.__out_params}')
+            if(trace):
+                logger.trace(f'{self.__class__.__name__} in_params:  {in_params}')
+                logger.trace(f'{self.__class__.__name__} out_params: {out_params}')
 
             # create in params
-            for p in filter(None, self.__in_params):
-                p = p.replace('?', '_', 1)
-                self.get_logger().trace(f'in: {p}')
-                exec(f'self.{p} = None')
+            for p in self.__in_attrs:
+                if(trace):
+                    logger.trace(f'in: {p}')
+                setattr(self, p, None)
 
             # create out params
-            for p in filter(None, self.__out_params):
-                p = p.replace('?', '_', 1)
-                self.get_logger().trace(f'out: {p}')
-                exec(f'self.{p} = None')
+            for p in self.__out_attrs:
+                if(trace):
+                    logger.trace(f'out: {p}')
+                setattr(self, p, None)
 
     # PRIVATE
 
     @final
     def __internal_on_timeout(self):
         # timeout can only occure when state is RUNNING OR SUSPENDED
-        if(self.get_status() == NodeStatus.RUNNING
-           or self.get_status() == NodeStatus.SUSPENDED):
+        if(self.get_status() in RUNNING_OR_SUSPENDED):
             self.on_timeout()
 
         self.cancel_timeout_timer()
@@ -101,12 +221,12 @@ class TreeNode(ABC):
         return self.bt_runner
 
     @final
-    def _internal_get_in_params(self) -> list:
-        return self.__in_params
+    def _internal_get_in_attrs(self) -> tuple:
+        return self.__in_attrs
 
     @final
-    def _internal_get_out_params(self) -> list:
-        return self.__out_params
+    def _internal_get_out_attrs(self) -> tuple:
+        return self.__out_attrs
 
     @final
     def _internal_append_to_contingency_history(self, entry: ContingencyHistoryEntry):
@@ -196,17 +316,15 @@ class TreeNode(ABC):
             The timeout in milliseconds
 
         """
-        self.__timeout_timer = Timer(timeout_ms/1000, self.__internal_on_timeout)
-        self.__timeout_timer.start()
+        self.__timeout_timer = _timeout_scheduler.schedule(timeout_ms,
+                                                           self.__internal_on_timeout)
 
     @final
     def cancel_timeout_timer(self) -> None:
         """Cancel the timeout timer of the node."""
         if(self.__timeout_timer is not None):
             self.get_logger().trace(f'{self.__class__.__name__} -> cancel timeout timer')
-            self.__timeout_timer.cancel()
-            # set the timer to None to make sure that all references (bound method)
-            # are released and the object gets destroyed by gc
+            _timeout_scheduler.cancel(self.__timeout_timer)
             self.__timeout_timer = None
 
     @final
@@ -222,10 +340,7 @@ class TreeNode(ABC):
         self.__node_status = node_status
         # If the status of the node is set to one of the following,
         # make sure that the timeout timer is canceled.
-        if(node_status == NodeStatus.SUCCESS
-           or node_status == NodeStatus.FAILURE
-           or node_status == NodeStatus.FIXED
-           or node_status == NodeStatus.ABORTED):
+        if(node_status in COMPLETED):
             self.cancel_timeout_timer()
 
     @final
@@ -294,4 +409,7 @@ class TreeNode(ABC):
             The throttle rate in milliseconds
 
         """
-        self._throttle_ms = throttle_ms
+        if(throttle_ms is None):
+            self._throttle_ns = None
+        else:
+            self._throttle_ns = throttle_ms * 1_000_000
@@ -38,7 +38,6 @@ class TestSimpleParallel:
                            r'AddTwoNumbersMultiTickActionWithTimeout: \(tick_count = 3/4\)\n'
                            r'AddTwoNumbersMultiTickActionWithTimeout: \(tick_count = 3/6\)\n'
                            r'AddTwoNumbersMultiTickActionWithTimeout: DONE 2 \+ 2 = 4\n'
-                           r'AddTwoNumbersMultiTickActionWithTimeout: \(tick_count = 4/6\)\n'
                            r'AddTwoNumbersMultiTickActionWithTimeout: on_abort\n')
         assert bool(re.match(regex, mock_print.getvalue()))
 
@@ -15,6 +15,7 @@
 from threading import Timer
 
 from carebt.fallbackNode import FallbackNode
+from carebt.nodeStatus import FAILURE_ONLY
 from carebt.nodeStatus import NodeStatus
 from tests.actionNodes import AddTwoNumbersActionWithFailure
 from tests.actionNodes import AddTwoNumbersLongRunningAction
@@ -144,7 +145,7 @@ class AddTwoNumbersFallback5(FallbackNode):
         self.append_child(AddTwoNumbersActionWithFailure, '3 6 => ?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.handle_missing_numbers)
 
@@ -185,7 +186,7 @@ class AddTwoNumbersFallback6(FallbackNode):
         self.append_child(AddTwoNumbersActionWithFailure, '4 8 => ?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.handle_missing_numbers)
 
@@ -224,7 +225,7 @@ class AddTwoNumbersFallback6a(FallbackNode):
         self.append_child(AddTwoNumbersActionWithFailure, '4 8 => ?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.handle_missing_numbers)
 
@@ -12,7 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import MagicMock
+from unittest.mock import call
 
 
-mock = MagicMock()
+class _CallRecorder():
+    """Record the calls in the order they are made.
+
+    A lightweight replacement for a `MagicMock` which only provides the parts
+    used by the tests, i.e. `called`, `call_args_list` and `reset_mock`. The
+    calls are recorded as `unittest.mock.call`, thus the expected calls can be
+    written as before.
+    """
+
+    __slots__ = ('call_args_list',)
+
+    def __init__(self):
+        self.call_args_list = []
+
+    def __call__(self, *args, **kwargs):
+        self.call_args_list.append(call(*args, **kwargs))
+
+    @property
+    def called(self) -> bool:
+        return len(self.call_args_list) != 0
+
+    def reset_mock(self) -> None:
+        self.call_args_list = []
+
+
+mock = _CallRecorder()
@@ -14,6 +14,7 @@
 
 from threading import Timer
 
+from carebt.nodeStatus import FAILURE_ONLY
 from carebt.nodeStatus import NodeStatus
 from carebt.parallelNode import ParallelNode
 from tests.actionNodes import AddTwoNumbersAction
@@ -56,6 +57,8 @@ class TickCountingParallel(ParallelNode):
     """The `TickCountingParallel` example node.
 
     The `TickCountingParallel` runs three `TickCountingAction` in parallel.
+    It is also the base of the variants below, which only differ in how they
+    handle a failing child. Thus, the mock messages use the name of the class.
 
     Input Parameters
     ----------------
@@ -78,176 +81,75 @@ class TickCountingParallel(ParallelNode):
 
     def __init__(self, bt_runner):
         super().__init__(bt_runner, None, '?success_threshold ?g1 ?s1 ?g2 ?s2 ?g3 ?s3')
-        mock('__init__ TickCountingParallel')
+        mock(f'__init__ {self.__class__.__name__}')
 
     def on_init(self) -> None:
-        mock(f'on_init TickCountingParallel success_threshold = {self.get_success_threshold()}')
+        success_threshold = self.get_success_threshold()
+        mock(f'on_init {self.__class__.__name__} success_threshold = {success_threshold}')
         self.set_success_threshold(self._success_threshold)
-        self.add_child(TickCountingAction, '1 ?g1 ?s1 => ?cnt1')
-        self.add_child(TickCountingAction, '2 ?g2 ?s2 => ?cnt2')
-        self.add_child(TickCountingAction, '3 ?g3 ?s3 => ?cnt3')
+        self.add_children([(TickCountingAction, '1 ?g1 ?s1 => ?cnt1'),
+                           (TickCountingAction, '2 ?g2 ?s2 => ?cnt2'),
+                           (TickCountingAction, '3 ?g3 ?s3 => ?cnt3')])
 
     def on_delete(self) -> None:
-        mock('on_delete TickCountingParallel')
+        mock(f'on_delete {self.__class__.__name__}')
 
     def __del__(self):
-        mock('__del__ TickCountingParallel')
+        mock(f'__del__ {self.__class__.__name__}')
 
 ########################################################################
 
 
-class TickCountingParallelWithAbort(ParallelNode):
+class TickCountingParallelWithAbort(TickCountingParallel):
     """The `TickCountingParallelWithAbort` example node.
 
     The `TickCountingParallelWithAbort` is a variant of `TickCountingParallel`
     which aborts on failure.
-
-    Input Parameters
-    ----------------
-    ?success_threshold: int
-        The success_threshold
-    ?g1: int
-        The goal of child 1
-    ?s1: int
-        Wether child 1 should succeed or fail
-    ?g2: int
-        The goal of child 1
-    ?s2: int
-        Wether child 1 should succeed or fail
-    ?g3: int
-        The goal of child 1
-    ?s3: int
-        Wether child 1 should succeed or fail
-
     """
 
-    def __init__(self, bt_runner):
-        super().__init__(bt_runner, None, '?success_threshold ?g1 ?s1 ?g2 ?s2 ?g3 ?s3')
-        mock('__init__ TickCountingParallelWithAbort')
-
-    def on_init(self) -> None:
-        mock('on_init TickCountingParallelWithAbort success_threshold = '
-             + f'{self.get_success_threshold()}')
-        self.set_success_threshold(self._success_threshold)
-        self.add_child(TickCountingAction, '1 ?g1 ?s1 => ?cnt1')
-        self.add_child(TickCountingAction, '2 ?g2 ?s2 => ?cnt2')
-        self.add_child(TickCountingAction, '3 ?g3 ?s3 => ?cnt3')
-
-        self.register_contingency_handler(TickCountingAction,
-                                          [NodeStatus.FAILURE],
-                                          'COUNTING_ERROR',
-                                          self.handle_error)
+    contingency_handlers = ((TickCountingAction,
+                             FAILURE_ONLY,
+                             'COUNTING_ERROR',
+                             'handle_error'),)
 
     def handle_error(self) -> None:
         self.abort()
         self.set_contingency_message('ANOTHER_COUNTING_ERROR')
 
-    def on_delete(self) -> None:
-        mock('on_delete TickCountingParallelWithAbort')
-
-    def __del__(self):
-        mock('__del__ TickCountingParallelWithAbort')
-
 ########################################################################
 
 
-class TickCountingParallelDelAdd1(ParallelNode):
+class TickCountingParallelDelAdd1(TickCountingParallel):
     """The `TickCountingParallelDelAdd1` example node.
 
     The `TickCountingParallelDelAdd1` is a variant of `TickCountingParallel`
     which deletes child 2 (id=3) and adds one new child on failure.
-
-    Input Parameters
-    ----------------
-    ?success_threshold: int
-        The success_threshold
-    ?g1: int
-        The goal of child 1
-    ?s1: int
-        Wether child 1 should succeed or fail
-    ?g2: int
-        The goal of child 1
-    ?s2: int
-        Wether child 1 should succeed or fail
-    ?g3: int
-        The goal of child 1
-    ?s3: int
-        Wether child 1 should succeed or fail
-
     """
 
-    def __init__(self, bt_runner):
-        super().__init__(bt_runner, None, '?success_threshold ?g1 ?s1 ?g2 ?s2 ?g3 ?s3')
-        mock('__init__ TickCountingParallelDelAdd1')
-
-    def on_init(self) -> None:
-        mock('on_init TickCountingParallelDelAdd1 success_threshold = '
-             + f'{self.get_success_threshold()}')
-        self.set_success_threshold(self._success_threshold)
-        self.add_child(TickCountingAction, '1 ?g1 ?s1 => ?cnt1')
-        self.add_child(TickCountingAction, '2 ?g2 ?s2 => ?cnt2')
-        self.add_child(TickCountingAction, '3 ?g3 ?s3 => ?cnt3')
-
-        self.register_contingency_handler(TickCountingAction,
-                                          [NodeStatus.FAILURE],
-                                          'COUNTING_ERROR',
-                                          self.handle_error)
+    contingency_handlers = ((TickCountingAction,
+                             FAILURE_ONLY,
+                             'COUNTING_ERROR',
+                             'handle_error'),)
 
     def handle_error(self) -> None:
         self.remove_child(2)
         self.add_child(TickCountingAction, '4 3 True => ?cnt4')
         self.set_success_threshold(2)
 
-    def on_delete(self) -> None:
-        mock('on_delete TickCountingParallelDelAdd1')
-
-    def __del__(self):
-        mock('__del__ TickCountingParallelDelAdd1')
-
 ########################################################################
 
 
-class TickCountingParallelDelAdd2(ParallelNode):
+class TickCountingParallelDelAdd2(TickCountingParallel):
     """The `TickCountingParallelDelAdd2` example node.
 
     The `TickCountingParallelDelAdd2` is a variant of `TickCountingParallel`
     which deletes child 2 (id=3) and adds two new children on failure.
-
-    Input Parameters
-    ----------------
-    ?success_threshold: int
-        The success_threshold
-    ?g1: int
-        The goal of child 1
-    ?s1: int
-        Wether child 1 should succeed or fail
-    ?g2: int
-        The goal of child 1
-    ?s2: int
-        Wether child 1 should succeed or fail
-    ?g3: int
-        The goal of child 1
-    ?s3: int
-        Wether child 1 should succeed or fail
-
     """
 
-    def __init__(self, bt_runner):
-        super().__init__(bt_runner, None, '?success_threshold ?g1 ?s1 ?g2 ?s2 ?g3 ?s3')
-        mock('__init__ TickCountingParallelDelAdd2')
-
-    def on_init(self) -> None:
-        mock('on_init TickCountingParallelDelAdd2 success_threshold = '
-             + f'{self.get_success_threshold()}')
-        self.set_success_threshold(self._success_threshold)
-        self.add_child(TickCountingAction, '1 ?g1 ?s1 => ?cnt1')
-        self.add_child(TickCountingAction, '2 ?g2 ?s2 => ?cnt2')
-        self.add_child(TickCountingAction, '3 ?g3 ?s3 => ?cnt3')
-
-        self.register_contingency_handler(TickCountingAction,
-                                          [NodeStatus.FAILURE],
-                                          'COUNTING_ERROR',
-                                          self.handle_error)
+    contingency_handlers = ((TickCountingAction,
+                             FAILURE_ONLY,
+                             'COUNTING_ERROR',
+                             'handle_error'),)
 
     def handle_error(self) -> None:
         self.remove_child(2)
@@ -255,111 +157,39 @@ class TickCountingParallelDelAdd2(ParallelNode):
         self.add_child(TickCountingAction, '5 5 True => ?cnt5')
         self.set_success_threshold(3)
 
-    def on_delete(self) -> None:
-        mock('on_delete TickCountingParallelDelAdd2')
-
-    def __del__(self):
-        mock('__del__ TickCountingParallelDelAdd2')
-
 ########################################################################
 
 
-class TickCountingParallelDel(ParallelNode):
-    """The `TickCountingParallelWithAbort` example node.
+class TickCountingParallelDel(TickCountingParallel):
+    """The `TickCountingParallelDel` example node.
 
-    The `TickCountingParallelWithAbort` is a variant of `TickCountingParallel`
+    The `TickCountingParallelDel` is a variant of `TickCountingParallel`
     which deletes child 2 (id=3) on failure.
-
-    Input Parameters
-    ----------------
-    ?success_threshold: int
-        The success_threshold
-    ?g1: int
-        The goal of child 1
-    ?s1: int
-        Wether child 1 should succeed or fail
-    ?g2: int
-        The goal of child 1
-    ?s2: int
-        Wether child 1 should succeed or fail
-    ?g3: int
-        The goal of child 1
-    ?s3: int
-        Wether child 1 should succeed or fail
-
     """
 
-    def __init__(self, bt_runner):
-        super().__init__(bt_runner, None, '?success_threshold ?g1 ?s1 ?g2 ?s2 ?g3 ?s3')
-        mock('__init__ TickCountingParallelDel')
-
-    def on_init(self) -> None:
-        mock('on_init TickCountingParallelDel success_threshold = '
-             + f'{self.get_success_threshold()}')
-        self.set_success_threshold(self._success_threshold)
-        self.add_child(TickCountingAction, '1 ?g1 ?s1 => ?cnt1')
-        self.add_child(TickCountingAction, '2 ?g2 ?s2 => ?cnt2')
-        self.add_child(TickCountingAction, '3 ?g3 ?s3 => ?cnt3')
-
-        self.register_contingency_handler(TickCountingAction,
-                                          [NodeStatus.FAILURE],
-                                          'COUNTING_ERROR',
-                                          self.handle_error)
+    contingency_handlers = ((TickCountingAction,
+                             FAILURE_ONLY,
+                             'COUNTING_ERROR',
+                             'handle_error'),)
 
     def handle_error(self) -> None:
         self.remove_child(2)
         self.set_success_threshold(1)
 
-    def on_delete(self) -> None:
-        mock('on_delete TickCountingParallelDel')
-
-    def __del__(self):
-        mock('__del__ TickCountingParallelDel')
-
 ########################################################################
 
 
-class TickCountingParallelDelAllAdd(ParallelNode):
+class TickCountingParallelDelAllAdd(TickCountingParallel):
     """The `TickCountingParallelDelAllAdd` example node.
 
     The `TickCountingParallelDelAllAdd` is a variant of `TickCountingParallel`
     which deletes all children and adds three new children on failure.
-
-    Input Parameters
-    ----------------
-    ?success_threshold: int
-        The success_threshold
-    ?g1: int
-        The goal of child 1
-    ?s1: int
-        Wether child 1 should succeed or fail
-    ?g2: int
-        The goal of child 1
-    ?s2: int
-        Wether child 1 should succeed or fail
-    ?g3: int
-        The goal of child 1
-    ?s3: int
-        Wether child 1 should succeed or fail
-
     """
 
-    def __init__(self, bt_runner):
-        super().__init__(bt_runner, None, '?success_threshold ?g1 ?s1 ?g2 ?s2 ?g3 ?s3')
-        mock('__init__ TickCountingParallelDelAllAdd')
-
-    def on_init(self) -> None:
-        mock('on_init TickCountingParallelDelAllAdd success_threshold = '
-             + f'{self.get_success_threshold()}')
-        self.set_success_threshold(self._success_threshold)
-        self.add_child(TickCountingAction, '1 ?g1 ?s1 => ?cnt1')
-        self.add_child(TickCountingAction, '2 ?g2 ?s2 => ?cnt2')
-        self.add_child(TickCountingAction, '3 ?g3 ?s3 => ?cnt3')
-
-        self.register_contingency_handler(TickCountingAction,
-                                          [NodeStatus.FAILURE],
-                                          'COUNTING_ERROR',
-                                          self.handle_error)
+    contingency_handlers = ((TickCountingAction,
+                             FAILURE_ONLY,
+                             'COUNTING_ERROR',
+                             'handle_error'),)
 
     def handle_error(self) -> None:
         self.remove_all_children()
@@ -368,12 +198,6 @@ class TickCountingParallelDelAllAdd(ParallelNode):
         self.add_child(TickCountingAction, '6 6 True => ?cnt6')
         self.set_success_threshold(3)
 
-    def on_delete(self) -> None:
-        mock('on_delete TickCountingParallelDelAllAdd')
-
-    def __del__(self):
-        mock('__del__ TickCountingParallelDelAllAdd')
-
 ########################################################################
 
 
@@ -435,6 +259,11 @@ class CountAbortParallelWithTick(ParallelNode):
 class ParallelRemoveSuccess(ParallelNode):
     """The `ParallelRemoveSuccess` example node."""
 
+    contingency_handlers = ((TickCountingAction,
+                             FAILURE_ONLY,
+                             'COUNTING_ERROR',
+                             'handle_error'),)
+
     def __init__(self, bt_runner):
         super().__init__(bt_runner, 2, '')
         mock('__init__ ParallelRemoveSuccess')
@@ -447,11 +276,6 @@ class ParallelRemoveSuccess(ParallelNode):
         self.add_child(TickCountingAction, '4 8 True => ?cnt')
         self.add_child(TickCountingAction, '5 99 True => ?cnt')
 
-        self.register_contingency_handler(TickCountingAction,
-                                          [NodeStatus.FAILURE],
-                                          'COUNTING_ERROR',
-                                          self.handle_error)
-
     def handle_error(self) -> None:
         self.remove_child(0)
 
@@ -484,3 +308,29 @@ class AsyncAddChildParallel(ParallelNode):
         self.set_status(NodeStatus.RUNNING)
         self.add_child(HelloWorldAction)
         self.add_child(HelloWorldAction)
+
+########################################################################
+
+
+class ShortCircuitParallel(ParallelNode):
+    """The `ShortCircuitParallel` example node.
+
+    The `ShortCircuitParallel` runs two `TickCountingAction` with a success_threshold
+    of one. The first child succeeds on its first tick, thus the second child is not
+    ticked anymore. It is still `IDLE`, but has to be deleted.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 1, '')
+        mock('__init__ ShortCircuitParallel')
+
+    def on_init(self) -> None:
+        mock('on_init ShortCircuitParallel')
+        self.add_children([(TickCountingAction, '1 1 True => ?cnt1'),
+                           (TickCountingAction, '2 5 True => ?cnt2')])
+
+    def on_delete(self) -> None:
+        mock('on_delete ShortCircuitParallel')
+
+    def __del__(self):
+        mock('__del__ ShortCircuitParallel')
@@ -15,6 +15,7 @@
 from threading import Timer
 
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
+from carebt.nodeStatus import FAILURE_ONLY
 from carebt.nodeStatus import NodeStatus
 from carebt.sequenceNode import SequenceNode
 from tests.actionNodes import AddTwoNumbersAction
@@ -157,7 +158,7 @@ class AddTwoNumbersSequence3(SequenceNode):
         self.append_child(ShowNumberAction, '?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.fix_missing_numbers_handler)
 
@@ -213,7 +214,7 @@ class AddTwoNumbersSequence4(SequenceNode):
         self.append_child(ShowNumberAction, '?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.fix_missing_numbers_handler)
 
@@ -259,7 +260,7 @@ class AddTwoNumbersSequence5(SequenceNode):
         self.append_child(ShowNumberAction, '?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.fix_missing_numbers_handler)
 
@@ -307,7 +308,7 @@ class AddTwoNumbersSequence6(SequenceNode):
         self.append_child(ShowNumberAction, '?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.fix_missing_numbers_handler)
 
@@ -365,7 +366,7 @@ class AddTwoNumbersSequence7(SequenceNode):
         self.append_child(ShowNumberAction, '?result')
 
         self.register_contingency_handler(r'AddTwoNumbers.*',
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.fix_missing_numbers_handler)
 
@@ -439,7 +440,7 @@ class AddTwoNumbersSequence8(SequenceNode):
         self.append_child(ShowNumberAction, '?result')
 
         self.register_contingency_handler(r'AddTwoNumbers.*',
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.fix_missing_numbers_handler)
 
@@ -552,7 +553,7 @@ class AddTwoNumbersSequence9(SequenceNode):
         self.append_child(ShowNumberAction, '?result')
 
         self.register_contingency_handler(AddTwoNumbersActionWithFailure,
-                                          [NodeStatus.FAILURE],
+                                          FAILURE_ONLY,
                                           'NOT_TWO_NUMBERS_PROVIDED',
                                           self.fix_missing_numbers_handler)
 
@@ -628,3 +629,134 @@ class AddTwoNumbersDynamic(SequenceNode):
         for self.v in values:
             self.append_child(AddTwoNumbersAction, 'v[0] 5 => ?result')
             self.append_child(ShowNumberAction, '?result')
+
+########################################################################
+
+
+class ContingencyMessageSequence(SequenceNode):
+    """The `ContingencyMessageSequence` example node.
+
+    The `ContingencyMessageSequence` runs an `AddTwoNumbersActionWithFailure` with
+    only one number, thus it fails with the message `NOT_TWO_NUMBERS_PROVIDED`. The
+    contingency-handler `fix_missing_numbers_handler` is registered with the provided
+    regex for the contingency message, which has to match the whole message.
+
+    Input Parameters
+    ----------------
+    ?message : str
+        The regex for the contingency message
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?message')
+        mock('__init__ ContingencyMessageSequence')
+
+    def on_init(self) -> None:
+        mock('on_init ContingencyMessageSequence')
+        self.append_child(AddTwoNumbersActionWithFailure, '1 None => ?result')
+
+        self.register_contingency_handler(AddTwoNumbersActionWithFailure,
+                                          FAILURE_ONLY,
+                                          self._message,
+                                          self.fix_missing_numbers_handler)
+
+    def fix_missing_numbers_handler(self):
+        mock('ContingencyMessageSequence: fix_missing_numbers_handler')
+        self.fix_current_child()
+
+    def on_delete(self) -> None:
+        mock('on_delete ContingencyMessageSequence')
+
+    def __del__(self):
+        mock('__del__ ContingencyMessageSequence')
+
+########################################################################
+
+
+class ContingencyClassNameSequence(SequenceNode):
+    """The `ContingencyClassNameSequence` example node.
+
+    The `ContingencyClassNameSequence` runs an `AddTwoNumbersActionWithFailure` with
+    only one number, thus it fails. The contingency-handler is registered for the
+    class `AddTwoNumbersAction`, which only matches this exact class and not the
+    `AddTwoNumbersActionWithFailure`. Thus, the handler is not triggered.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '')
+        mock('__init__ ContingencyClassNameSequence')
+
+    def on_init(self) -> None:
+        mock('on_init ContingencyClassNameSequence')
+        self.append_child(AddTwoNumbersActionWithFailure, '1 None => ?result')
+
+        self.register_contingency_handler(AddTwoNumbersAction,
+                                          FAILURE_ONLY,
+                                          'NOT_TWO_NUMBERS_PROVIDED',
+                                          self.fix_missing_numbers_handler)
+
+    def fix_missing_numbers_handler(self):
+        mock('ContingencyClassNameSequence: fix_missing_numbers_handler')
+        self.fix_current_child()
+
+    def on_delete(self) -> None:
+        mock('on_delete ContingencyClassNameSequence')
+
+    def __del__(self):
+        mock('__del__ ContingencyClassNameSequence')
+
+########################################################################
+
+
+class ContingencyOrderSequence(SequenceNode):
+    """The `ContingencyOrderSequence` example node.
+
+    The `ContingencyOrderSequence` runs an `AddTwoNumbersActionWithFailure` with
+    only one number, thus it fails. Two contingency-handlers match this contingency,
+    one registered for the class `AddTwoNumbersActionWithFailure` and one registered
+    with the regex 'AddTwoNumbers.*'. The one registered first is triggered.
+
+    Input Parameters
+    ----------------
+    ?class_first : bool
+        Whether the handler for the class is registered before the regex handler
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?class_first')
+        mock('__init__ ContingencyOrderSequence')
+
+    def on_init(self) -> None:
+        mock('on_init ContingencyOrderSequence')
+        self.append_child(AddTwoNumbersActionWithFailure, '1 None => ?result')
+
+        if(self._class_first):
+            self.register_contingency_handler(AddTwoNumbersActionWithFailure,
+                                              FAILURE_ONLY,
+                                              'NOT_TWO_NUMBERS_PROVIDED',
+                                              self.class_handler)
+        self.register_contingency_handler(r'AddTwoNumbers.*',
+                                          FAILURE_ONLY,
+                                          'NOT_TWO_NUMBERS_PROVIDED',
+                                          self.regex_handler)
+        if(not self._class_first):
+            self.register_contingency_handler(AddTwoNumbersActionWithFailure,
+                                              FAILURE_ONLY,
+                                              'NOT_TWO_NUMBERS_PROVIDED',
+                                              self.class_handler)
+
+    def class_handler(self):
+        mock('ContingencyOrderSequence: class_handler')
+        self.fix_current_child()
+
+    def regex_handler(self):
+        mock('ContingencyOrderSequence: regex_handler')
+        self.fix_current_child()
+
+    def on_delete(self) -> None:
+        mock('on_delete ContingencyOrderSequence')
+
+    def __del__(self):
+        mock('__del__ ContingencyOrderSequence')
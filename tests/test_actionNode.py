@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+from time import monotonic_ns
 from unittest.mock import call
 
 from carebt.abstractLogger import LogLevel
@@ -216,12 +216,12 @@ class TestActionNode:
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
         bt_runner.set_tick_rate_ms(10)
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersMultiTickActionWithTimeout, '5 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 55
-        assert int(delta.total_seconds() * 1000) < 70
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 55
+        assert delta_ms < 70
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersMultiTickActionWithTimeout'),
                                        call('on_init AddTwoNumbersMultiTickActionWithTimeout'),
@@ -263,12 +263,12 @@ class TestActionNode:
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
         bt_runner.set_tick_rate_ms(10)
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersThrottledMultiTickAction, '5 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 2400
-        assert int(delta.total_seconds() * 1000) < 2600
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 2400
+        assert delta_ms < 2600
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersThrottledMultiTickAction'),
                                        call('on_init AddTwoNumbersThrottledMultiTickAction'),
@@ -290,12 +290,12 @@ class TestActionNode:
         """Test a long running calculation."""
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersLongRunningAction, '500 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 500
-        assert int(delta.total_seconds() * 1000) < 600
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 500
+        assert delta_ms < 600
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersLongRunningAction'),
                                        call('on_init AddTwoNumbersLongRunningAction'),
@@ -314,12 +314,12 @@ class TestActionNode:
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
         bt_runner.set_tick_rate_ms(10)
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersLongRunningActionWithAbort, '100 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 100
-        assert int(delta.total_seconds() * 1000) < 200
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 100
+        assert delta_ms < 200
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
                                        call('on_init AddTwoNumbersLongRunningActionWithAbort'),
@@ -340,12 +340,12 @@ class TestActionNode:
         """
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersLongRunningActionWithAbort, '1500 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 1000
-        assert int(delta.total_seconds() * 1000) < 1100
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 1000
+        assert delta_ms < 1100
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
                                        call('on_init AddTwoNumbersLongRunningActionWithAbort'),
@@ -369,12 +369,12 @@ class TestActionNode:
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
         bt_runner.set_tick_rate_ms(10)
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersLongRunningActionMissingCallback, '100 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 100
-        assert int(delta.total_seconds() * 1000) < 200
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 100
+        assert delta_ms < 200
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersLongRunningActionMissingCallback'),  # noqa: E501
                                        call('on_init AddTwoNumbersLongRunningActionMissingCallback'),  # noqa: E501
@@ -394,12 +394,12 @@ class TestActionNode:
         """
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersLongRunningActionMissingCallback, '1500 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 1000
-        assert int(delta.total_seconds() * 1000) < 1100
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 1000
+        assert delta_ms < 1100
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersLongRunningActionMissingCallback'),  # noqa: E501
                                        call('on_init AddTwoNumbersLongRunningActionMissingCallback'),  # noqa: E501
@@ -423,12 +423,12 @@ class TestActionNode:
         """
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersLongRunningActionMissingCallback2, '1500 3 5 => ?result')
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 1000
-        assert int(delta.total_seconds() * 1000) < 1100
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 1000
+        assert delta_ms < 1100
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersLongRunningActionMissingCallback2'),  # noqa: E501
                                        call('on_init AddTwoNumbersLongRunningActionMissingCallback2'),  # noqa: E501
@@ -54,6 +54,47 @@ class CustomLogger(AbstractLogger):
             mock(f'ERROR {msg}')
 
 
+class OwnLevelLogger(AbstractLogger):
+    """A custom logger which does not call `super().__init__()`.
+
+    It filters the messages by its own level, thus it overrides `is_enabled_for`.
+    """
+
+    def __init__(self, own_level: LogLevel):
+        self.own_level = own_level
+
+    # PUBLIC
+
+    def is_enabled_for(self, log_level: LogLevel) -> bool:
+        return self.own_level <= log_level
+
+    def trace(self, msg: str):
+        if(self.own_level <= LogLevel.TRACE):
+            mock(f'TRACE {msg}')
+
+    def debug(self, msg: str):
+        if(self.own_level <= LogLevel.DEBUG):
+            mock(f'DEBUG {msg}')
+
+    def info(self, msg: str):
+        if(self.own_level <= LogLevel.INFO):
+            mock(f'INFO {msg}')
+
+    def warn(self, msg: str):
+        if(self.own_level <= LogLevel.WARN):
+            mock(f'WARN {msg}')
+
+    def error(self, msg: str):
+        if(self.own_level <= LogLevel.ERROR):
+            mock(f'ERROR {msg}')
+
+
+class NoInitLogger(OwnLevelLogger):
+    """A custom logger which relies on the default `is_enabled_for`."""
+
+    is_enabled_for = AbstractLogger.is_enabled_for
+
+
 class TestLogger:
 
     @patch('sys.stdout', new_callable=StringIO)
@@ -196,3 +237,40 @@ class TestLogger:
         assert bool(re.match(regex, mock_print.getvalue()))
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
+
+    def test_is_enabled_for(self):
+        self.logger = SimplePrintLogger()
+        self.logger.set_log_level(LogLevel.INFO)
+        assert not self.logger.is_enabled_for(LogLevel.TRACE)
+        assert not self.logger.is_enabled_for(LogLevel.DEBUG)
+        assert self.logger.is_enabled_for(LogLevel.INFO)
+        assert self.logger.is_enabled_for(LogLevel.WARN)
+        assert self.logger.is_enabled_for(LogLevel.ERROR)
+        self.logger.set_log_level(LogLevel.OFF)
+        assert not self.logger.is_enabled_for(LogLevel.ERROR)
+
+    def test_custom_logger_own_level(self):
+        """Test a custom logger which filters by its own level."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_logger(OwnLevelLogger(LogLevel.TRACE))
+        bt_runner.run(HelloWorldAction)
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        assert call('TRACE ticking HelloWorldAction - NodeStatus.IDLE') \
+            in mock.call_args_list
+
+    def test_custom_logger_without_init(self):
+        """Test a custom logger which does not call `super().__init__()`.
+
+        Without a level set by `AbstractLogger.__init__`, `is_enabled_for`
+        passes all messages to the logger.
+        """
+        mock.reset_mock()
+        logger = NoInitLogger(LogLevel.TRACE)
+        assert logger.is_enabled_for(LogLevel.TRACE)
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_logger(logger)
+        bt_runner.run(HelloWorldAction)
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        assert call('TRACE ticking HelloWorldAction - NodeStatus.IDLE') \
+            in mock.call_args_list
@@ -12,18 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+from time import monotonic_ns
 from unittest.mock import call
 
 from carebt.abstractLogger import LogLevel
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import FAILURE_ONLY
 from carebt.nodeStatus import NodeStatus
+from carebt.parallelNode import ParallelNode
+import pytest
+from tests.actionNodes import TickCountingAction
 from tests.global_mock import mock
 from tests.parallelNodes import AddTwoNumbersParallel
 from tests.parallelNodes import AsyncAddChildParallel
 from tests.parallelNodes import CountAbortParallel
 from tests.parallelNodes import CountAbortParallelWithTick
 from tests.parallelNodes import ParallelRemoveSuccess
+from tests.parallelNodes import ShortCircuitParallel
 from tests.parallelNodes import TickCountingParallel
 from tests.parallelNodes import TickCountingParallelDel
 from tests.parallelNodes import TickCountingParallelDelAdd1
@@ -144,7 +149,6 @@ class TestParallelNode:
                                        call('TickCountingAction id = 2 DONE with FAILURE'),
                                        call('on_delete TickCountingAction id = 2'),
                                        call('__del__ TickCountingAction id = 2'),
-                                       call('TickCountingAction id = 3 tick: 3/5'),
                                        call('on_abort TickCountingAction id = 1'),
                                        call('on_delete TickCountingAction id = 1'),
                                        call('__del__ TickCountingAction id = 1'),
@@ -502,12 +506,12 @@ class TestParallelNode:
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
         bt_runner.get_logger().set_log_level(LogLevel.TRACE)
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(CountAbortParallelWithTick)
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 600
-        assert int(delta.total_seconds() * 1000) < 700
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 600
+        assert delta_ms < 700
         assert mock.called
         assert bt_runner._instance.get_status() == NodeStatus.FAILURE
         assert bt_runner._instance.get_contingency_message() == 'COUNTING_ERROR'
@@ -590,8 +594,6 @@ class TestParallelNode:
                                        call('TickCountingAction id = 3 DONE with SUCCESS'),
                                        call('on_delete TickCountingAction id = 3'),
                                        call('__del__ TickCountingAction id = 3'),
-                                       call('TickCountingAction id = 4 tick: 6/8'),
-                                       call('TickCountingAction id = 5 tick: 6/99'),
                                        call('on_abort TickCountingAction id = 4'),
                                        call('on_delete TickCountingAction id = 4'),
                                        call('__del__ TickCountingAction id = 4'),
@@ -621,3 +623,50 @@ class TestParallelNode:
                                        call('__del__ HelloWorldAction'),
                                        call('HelloWorldAction: Hello World !!!'),
                                        call('__del__ HelloWorldAction')]
+
+    ########################################################################
+
+    def test_contingency_handlers_unknown_function(self):
+        """Test declaring a contingency-handler with an unknown function name.
+
+        The function names of the declared contingency-handlers are checked when
+        the class is created.
+        """
+        with pytest.raises(AttributeError, match='handle_eror'):
+            class MisspelledHandlerParallel(ParallelNode):
+                contingency_handlers = ((TickCountingAction,
+                                         FAILURE_ONLY,
+                                         'COUNTING_ERROR',
+                                         'handle_eror'),)
+
+                def handle_error(self) -> None:
+                    pass
+
+    ########################################################################
+
+    def test_ShortCircuitParallel(self):
+        """Test the `ShortCircuitParallel` node.
+
+        The result is decided by the first child, thus the second child is not
+        ticked. It is still `IDLE`, thus it is not aborted, but it is deleted.
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ShortCircuitParallel)
+        assert mock.called
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        assert bt_runner._instance.get_contingency_message() == ''
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('__init__ ShortCircuitParallel'),
+                                       call('on_init ShortCircuitParallel'),
+                                       call('__init__ TickCountingAction'),
+                                       call('on_init TickCountingAction id = 1'),
+                                       call('__init__ TickCountingAction'),
+                                       call('on_init TickCountingAction id = 2'),
+                                       call('TickCountingAction id = 1 DONE with SUCCESS'),
+                                       call('on_delete TickCountingAction id = 1'),
+                                       call('__del__ TickCountingAction id = 1'),
+                                       call('on_delete TickCountingAction id = 2'),
+                                       call('__del__ TickCountingAction id = 2'),
+                                       call('on_delete ShortCircuitParallel'),
+                                       call('__del__ ShortCircuitParallel')]
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+from time import monotonic_ns
 from unittest.mock import call
 
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
@@ -40,12 +40,12 @@ class TestRateControlNode:
         """
         mock.reset_mock()
         bt = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt.run(RateControlledAddTwoNumbersMultiTickAction)
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 1250
-        assert int(delta.total_seconds() * 1000) < 1350
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 1250
+        assert delta_ms < 1350
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ RateControlledAddTwoNumbersMultiTickAction'),  # noqa: E501
                                        call('on_init RateControlledAddTwoNumbersMultiTickAction'),  # noqa: E501
@@ -76,12 +76,12 @@ class TestRateControlNode:
         """
         mock.reset_mock()
         bt = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt.run(RateControlledAddTwoNumbersMultiTickActionWithTimeout)
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 1000
-        assert int(delta.total_seconds() * 1000) < 1200
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 1000
+        assert delta_ms < 1200
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ RateControlledAddTwoNumbersMultiTickActionWithTimeout'),  # noqa: E501
                                        call('on_init RateControlledAddTwoNumbersMultiTickActionWithTimeout'),  # noqa: E501
@@ -109,12 +109,12 @@ class TestRateControlNode:
         """
         mock.reset_mock()
         bt = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt.run(RateControlledAddTwoNumbersMultiTickActionOwnTimeout)
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 1000
-        assert int(delta.total_seconds() * 1000) < 1200
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 1000
+        assert delta_ms < 1200
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ RateControlledAddTwoNumbersMultiTickActionOwnTimeout'),  # noqa: E501
                                        call('on_init RateControlledAddTwoNumbersMultiTickActionOwnTimeout'),  # noqa: E501
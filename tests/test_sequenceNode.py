@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+from time import monotonic_ns
 from unittest.mock import call
 
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
@@ -30,6 +30,9 @@ from tests.sequenceNodes import AddTwoNumbersSequence7
 from tests.sequenceNodes import AddTwoNumbersSequence8
 from tests.sequenceNodes import AddTwoNumbersSequence9
 from tests.sequenceNodes import AsyncAddChildSequence
+from tests.sequenceNodes import ContingencyClassNameSequence
+from tests.sequenceNodes import ContingencyMessageSequence
+from tests.sequenceNodes import ContingencyOrderSequence
 from tests.sequenceNodes import RemoveAllChildrenSequence
 from tests.sequenceNodes import SequenceWithSuccessMessage_1
 from tests.sequenceNodes import SequenceWithSuccessMessage_2
@@ -42,6 +45,22 @@ class TestSequenceNode:
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence1 = [
+        call('__init__ AddTwoNumbersSequence1'),
+        call('on_init AddTwoNumbersSequence1'),
+        call('__init__ AddTwoNumbersAction'),
+        call('on_init AddTwoNumbersAction'),
+        call('AddTwoNumbersAction: calculating: 3 + 6 = 9'),
+        call('on_delete AddTwoNumbersAction'),
+        call('__del__ AddTwoNumbersAction'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 9!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence1'),
+        call('__del__ AddTwoNumbersSequence1')]
+
     def test_AddTwoNumbersSequence1(self):
         """Test the `AddTwoNumbersSequence1` node."""
         mock.reset_mock()
@@ -51,56 +70,62 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence1'),
-                                       call('on_init AddTwoNumbersSequence1'),
-                                       call('__init__ AddTwoNumbersAction'),
-                                       call('on_init AddTwoNumbersAction'),
-                                       call('AddTwoNumbersAction: calculating: 3 + 6 = 9'),
-                                       call('on_delete AddTwoNumbersAction'),
-                                       call('__del__ AddTwoNumbersAction'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 9!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence1'),
-                                       call('__del__ AddTwoNumbersSequence1')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence1
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence1a = [
+        call('__init__ AddTwoNumbersSequence1a'),
+        call('on_init AddTwoNumbersSequence1a'),
+        call('__init__ AddTwoNumbersAction'),
+        call('on_init AddTwoNumbersAction'),
+        call('AddTwoNumbersAction: calculating: 3 + 6 = 9'),
+        call('on_tick AddTwoNumbersSequence1a'),
+        call('on_delete AddTwoNumbersAction'),
+        call('__del__ AddTwoNumbersAction'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 9!'),
+        call('on_tick AddTwoNumbersSequence1a'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence1a'),
+        call('__del__ AddTwoNumbersSequence1a')]
+
     def test_AddTwoNumbersSequence1a(self):
         """Test the `AddTwoNumbersSequence1a` node."""
         mock.reset_mock()
         bt_runner = BehaviorTreeRunner()
-        start = datetime.now()
+        start = monotonic_ns()
         bt_runner.run(AddTwoNumbersSequence1a)
-        end = datetime.now()
-        delta = end - start
-        assert int(delta.total_seconds() * 1000) > 200
-        assert int(delta.total_seconds() * 1000) < 300
+        end = monotonic_ns()
+        delta_ms = (end - start) // 1_000_000
+        assert delta_ms > 200
+        assert delta_ms < 300
         assert mock.called
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence1a'),
-                                       call('on_init AddTwoNumbersSequence1a'),
-                                       call('__init__ AddTwoNumbersAction'),
-                                       call('on_init AddTwoNumbersAction'),
-                                       call('AddTwoNumbersAction: calculating: 3 + 6 = 9'),
-                                       call('on_tick AddTwoNumbersSequence1a'),
-                                       call('on_delete AddTwoNumbersAction'),
-                                       call('__del__ AddTwoNumbersAction'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 9!'),
-                                       call('on_tick AddTwoNumbersSequence1a'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence1a'),
-                                       call('__del__ AddTwoNumbersSequence1a')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence1a
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence2_1_2 = [
+        call('__init__ AddTwoNumbersSequence2'),
+        call('on_init AddTwoNumbersSequence2'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence2'),
+        call('__del__ AddTwoNumbersSequence2')]
+
     def test_AddTwoNumbersSequence2_1_2(self):
         """Test the `AddTwoNumbersSequence2` node with two valid inputs."""
         mock.reset_mock()
@@ -110,20 +135,18 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence2'),
-                                       call('on_init AddTwoNumbersSequence2'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence2'),
-                                       call('__del__ AddTwoNumbersSequence2')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence2_1_2
+
+    _calls_AddTwoNumbersSequence2_1 = [
+        call('__init__ AddTwoNumbersSequence2'),
+        call('on_init AddTwoNumbersSequence2'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('on_delete AddTwoNumbersSequence2'),
+        call('__del__ AddTwoNumbersSequence2')]
 
     def test_AddTwoNumbersSequence2_1(self):
         """Test the `AddTwoNumbersSequence2` node.
@@ -139,18 +162,26 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.FAILURE
         assert bt_runner._instance.get_contingency_message() == 'NOT_TWO_NUMBERS_PROVIDED'
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence2'),
-                                       call('on_init AddTwoNumbersSequence2'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('on_delete AddTwoNumbersSequence2'),
-                                       call('__del__ AddTwoNumbersSequence2')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence2_1
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence3_1_2 = [
+        call('__init__ AddTwoNumbersSequence3'),
+        call('on_init AddTwoNumbersSequence3'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence3'),
+        call('__del__ AddTwoNumbersSequence3')]
+
     def test_AddTwoNumbersSequence3_1_2(self):
         """Test the `AddTwoNumbersSequence3` node with two valid inputs."""
         mock.reset_mock()
@@ -160,20 +191,24 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence3'),
-                                       call('on_init AddTwoNumbersSequence3'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence3'),
-                                       call('__del__ AddTwoNumbersSequence3')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence3_1_2
+
+    _calls_AddTwoNumbersSequence3_1 = [
+        call('__init__ AddTwoNumbersSequence3'),
+        call('on_init AddTwoNumbersSequence3'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('AddTwoNumbersSequence3: fix_missing_numbers_handler: set result to 999'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 999!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence3'),
+        call('__del__ AddTwoNumbersSequence3')]
 
     def test_AddTwoNumbersSequence3_1(self):
         """Test the `AddTwoNumbersSequence3` node.
@@ -190,24 +225,26 @@ class TestSequenceNode:
         assert bt_runner._instance.get_contingency_message() == 'MISSING_NUMBERS_FIXED'
         assert len(bt_runner._instance.get_contingency_history()) == 1
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence3'),
-                                       call('on_init AddTwoNumbersSequence3'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),  # noqa: E501
-                                       call('AddTwoNumbersSequence3: fix_missing_numbers_handler: set result to 999'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 999!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence3'),
-                                       call('__del__ AddTwoNumbersSequence3')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence3_1
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence4_1_2 = [
+        call('__init__ AddTwoNumbersSequence4'),
+        call('on_init AddTwoNumbersSequence4'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence4'),
+        call('__del__ AddTwoNumbersSequence4')]
+
     def test_AddTwoNumbersSequence4_1_2(self):
         """Test the `AddTwoNumbersSequence4` node with two valid inputs."""
         mock.reset_mock()
@@ -217,20 +254,28 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence4'),
-                                       call('on_init AddTwoNumbersSequence4'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence4'),
-                                       call('__del__ AddTwoNumbersSequence4')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence4_1_2
+
+    _calls_AddTwoNumbersSequence4_1 = [
+        call('__init__ AddTwoNumbersSequence4'),
+        call('on_init AddTwoNumbersSequence4'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ FixMissingNumbersAction'),
+        call('on_init FixMissingNumbersAction'),
+        call('FixMissingNumbersAction: fix missing numbers!'),
+        call('on_delete FixMissingNumbersAction'),
+        call('__del__ FixMissingNumbersAction'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 42!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence4'),
+        call('__del__ AddTwoNumbersSequence4')]
 
     def test_AddTwoNumbersSequence4_1(self):
         """Tests the `AddTwoNumbersSequence4` node.
@@ -247,28 +292,26 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence4'),
-                                       call('on_init AddTwoNumbersSequence4'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ FixMissingNumbersAction'),
-                                       call('on_init FixMissingNumbersAction'),
-                                       call('FixMissingNumbersAction: fix missing numbers!'),
-                                       call('on_delete FixMissingNumbersAction'),
-                                       call('__del__ FixMissingNumbersAction'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 42!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence4'),
-                                       call('__del__ AddTwoNumbersSequence4')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence4_1
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence5_1_2 = [
+        call('__init__ AddTwoNumbersSequence5'),
+        call('on_init AddTwoNumbersSequence5'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence5'),
+        call('__del__ AddTwoNumbersSequence5')]
+
     def test_AddTwoNumbersSequence5_1_2(self):
         """Test the `AddTwoNumbersSequence5` node with two valid inputs."""
         mock.reset_mock()
@@ -278,20 +321,34 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence5'),
-                                       call('on_init AddTwoNumbersSequence5'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence5'),
-                                       call('__del__ AddTwoNumbersSequence5')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence5_1_2
+
+    _calls_AddTwoNumbersSequence5_1 = [
+        call('__init__ AddTwoNumbersSequence5'),
+        call('on_init AddTwoNumbersSequence5'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('AddTwoNumbersSequence5: fix_missing_numbers_handler: provide two numbers'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ProvideMissingNumbersAction'),
+        call('on_init ProvideMissingNumbersAction'),
+        call('ProvideMissingNumbersAction: provide missing numbers!'),
+        call('on_delete ProvideMissingNumbersAction'),
+        call('__del__ ProvideMissingNumbersAction'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 11 + 22 = 33'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 33!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence5'),
+        call('__del__ AddTwoNumbersSequence5')]
 
     def test_AddTwoNumbersSequence5_1(self):
         """Test the `AddTwoNumbersSequence5` node.
@@ -309,34 +366,26 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence5'),
-                                       call('on_init AddTwoNumbersSequence5'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),  # noqa: E501
-                                       call('AddTwoNumbersSequence5: fix_missing_numbers_handler: provide two numbers'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ProvideMissingNumbersAction'),
-                                       call('on_init ProvideMissingNumbersAction'),
-                                       call('ProvideMissingNumbersAction: provide missing numbers!'),  # noqa: E501
-                                       call('on_delete ProvideMissingNumbersAction'),
-                                       call('__del__ ProvideMissingNumbersAction'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 11 + 22 = 33'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 33!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence5'),
-                                       call('__del__ AddTwoNumbersSequence5')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence5_1
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence6_1_2 = [
+        call('__init__ AddTwoNumbersSequence6'),
+        call('on_init AddTwoNumbersSequence6'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence6'),
+        call('__del__ AddTwoNumbersSequence6')]
+
     def test_AddTwoNumbersSequence6_1_2(self):
         """Test the `AddTwoNumbersSequence6` node with two valid inputs."""
         mock.reset_mock()
@@ -346,20 +395,29 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence6'),
-                                       call('on_init AddTwoNumbersSequence6'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence6'),
-                                       call('__del__ AddTwoNumbersSequence6')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence6_1_2
+
+    _calls_AddTwoNumbersSequence6_1 = [
+        call('__init__ AddTwoNumbersSequence6'),
+        call('on_init AddTwoNumbersSequence6'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('AddTwoNumbersSequence6: fix_missing_numbers_handler: provide two numbers'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 111 + 222 = 333'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 333!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence6'),
+        call('__del__ AddTwoNumbersSequence6')]
 
     def test_AddTwoNumbersSequence6_1(self):
         """Test the `AddTwoNumbersSequence6` node.
@@ -377,29 +435,37 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence6'),
-                                       call('on_init AddTwoNumbersSequence6'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),  # noqa: E501
-                                       call('AddTwoNumbersSequence6: fix_missing_numbers_handler: provide two numbers'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 111 + 222 = 333'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 333!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence6'),
-                                       call('__del__ AddTwoNumbersSequence6')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence6_1
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence7_50_1_2 = [
+        call('__init__ AddTwoNumbersSequence7'),
+        call('on_init AddTwoNumbersSequence7'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_init AddTwoNumbersLongRunningActionWithAbort'),
+        call('AddTwoNumbersLongRunningActionWithAbort: calculating 50 ms ... (timeout = 1000 ms)'),
+        call('AddTwoNumbersLongRunningActionWithAbort: done_callback: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
+        call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence7'),
+        call('__del__ AddTwoNumbersSequence7')]
+
     def test_AddTwoNumbersSequence7_50_1_2(self):
         """Test the `AddTwoNumbersSequence7` node.
 
@@ -414,31 +480,35 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence7'),
-                                       call('on_init AddTwoNumbersSequence7'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_init AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('AddTwoNumbersLongRunningActionWithAbort: calculating 50 ms ... (timeout = 1000 ms)'),  # noqa: E501
-                                       call('AddTwoNumbersLongRunningActionWithAbort: done_callback: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence7'),
-                                       call('__del__ AddTwoNumbersSequence7')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence7_50_1_2
+
+    _calls_AddTwoNumbersSequence7_750_1_2 = [
+        call('__init__ AddTwoNumbersSequence7'),
+        call('on_init AddTwoNumbersSequence7'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_init AddTwoNumbersLongRunningActionWithAbort'),
+        call('AddTwoNumbersLongRunningActionWithAbort: calculating 750 ms ... (timeout = 1000 ms)'),  # noqa: E501
+        call('AddTwoNumbersSequence7: on_timeout'),
+        call('on_abort AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
+        call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 9999!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence7'),
+        call('__del__ AddTwoNumbersSequence7')]
 
     def test_AddTwoNumbersSequence7_750_1_2(self):
         """Test the `AddTwoNumbersSequence7` node.
@@ -456,32 +526,35 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence7'),
-                                       call('on_init AddTwoNumbersSequence7'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_init AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('AddTwoNumbersLongRunningActionWithAbort: calculating 750 ms ... (timeout = 1000 ms)'),  # noqa: E501
-                                       call('AddTwoNumbersSequence7: on_timeout'),
-                                       call('on_abort AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 9999!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence7'),
-                                       call('__del__ AddTwoNumbersSequence7')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence7_750_1_2
+
+    _calls_AddTwoNumbersSequence7_50_1 = [
+        call('__init__ AddTwoNumbersSequence7'),
+        call('on_init AddTwoNumbersSequence7'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('AddTwoNumbersSequence7: fix_missing_numbers_handler'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 1234!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_init AddTwoNumbersLongRunningActionWithAbort'),
+        call('AddTwoNumbersLongRunningActionWithAbort: You did not provide two numbers!'),
+        call('AddTwoNumbersSequence7: fix_missing_numbers_handler'),
+        call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
+        call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 1234!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence7'),
+        call('__del__ AddTwoNumbersSequence7')]
 
     def test_AddTwoNumbersSequence7_50_1(self):
         """Test the `AddTwoNumbersSequence7` node.
@@ -497,35 +570,34 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence7'),
-                                       call('on_init AddTwoNumbersSequence7'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),  # noqa: E501
-                                       call('AddTwoNumbersSequence7: fix_missing_numbers_handler'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 1234!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_init AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('AddTwoNumbersLongRunningActionWithAbort: You did not provide two numbers!'),  # noqa: E501
-                                       call('AddTwoNumbersSequence7: fix_missing_numbers_handler'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 1234!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence7'),
-                                       call('__del__ AddTwoNumbersSequence7')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence7_50_1
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence8_750_1_2 = [
+        call('__init__ AddTwoNumbersSequence8'),
+        call('on_init AddTwoNumbersSequence8'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 3!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_init AddTwoNumbersLongRunningActionWithAbort'),
+        call('AddTwoNumbersLongRunningActionWithAbort: calculating 750 ms ... (timeout = 1000 ms)'),  # noqa: E501
+        call('AddTwoNumbersSequence8: on_timeout'),
+        call('on_abort AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_abort AddTwoNumbersSequence8'),
+        call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
+        call('on_delete AddTwoNumbersSequence8'),
+        call('__del__ AddTwoNumbersSequence8')]
+
     def test_AddTwoNumbersSequence8_750_1_2(self):
         """Test the `AddTwoNumbersSequence8` node.
 
@@ -541,31 +613,22 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.ABORTED
         assert bt_runner._instance.get_contingency_message() == 'TIMEOUT'
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence8'),
-                                       call('on_init AddTwoNumbersSequence8'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: calculating: 1 + 2 = 3'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 3!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('__init__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_init AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('AddTwoNumbersLongRunningActionWithAbort: calculating 750 ms ... (timeout = 1000 ms)'),  # noqa: E501
-                                       call('AddTwoNumbersSequence8: on_timeout'),
-                                       call('on_abort AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_abort AddTwoNumbersSequence8'),
-                                       call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_delete AddTwoNumbersSequence8'),
-                                       call('__del__ AddTwoNumbersSequence8')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence8_750_1_2
 
     ########################################################################
 
+    _calls_SequenceWithSuccessMessage_1 = [
+        call('__init__ SequenceWithSuccessMessage_1'),
+        call('on_init SequenceWithSuccessMessage_1'),
+        call('__init__ HelloWorldActionWithMessage'),
+        call('HelloWorldActionWithMessage: Hello World !!!'),
+        call('__del__ HelloWorldActionWithMessage'),
+        call('__init__ HelloWorldAction'),
+        call('HelloWorldAction: Hello World !!!'),
+        call('__del__ HelloWorldAction'),
+        call('on_delete SequenceWithSuccessMessage_1'),
+        call('__del__ SequenceWithSuccessMessage_1')]
+
     def test_SequenceWithSuccessMessage_1(self):
         """Test the `SequenceWithSuccessMessage` node."""
         mock.reset_mock()
@@ -575,16 +638,19 @@ class TestSequenceNode:
         assert bt_runner.get_status() == NodeStatus.SUCCESS
         assert bt_runner.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ SequenceWithSuccessMessage_1'),
-                                       call('on_init SequenceWithSuccessMessage_1'),
-                                       call('__init__ HelloWorldActionWithMessage'),
-                                       call('HelloWorldActionWithMessage: Hello World !!!'),
-                                       call('__del__ HelloWorldActionWithMessage'),
-                                       call('__init__ HelloWorldAction'),
-                                       call('HelloWorldAction: Hello World !!!'),
-                                       call('__del__ HelloWorldAction'),
-                                       call('on_delete SequenceWithSuccessMessage_1'),
-                                       call('__del__ SequenceWithSuccessMessage_1')]
+        assert mock.call_args_list == self._calls_SequenceWithSuccessMessage_1
+
+    _calls_SequenceWithSuccessMessage_2 = [
+        call('__init__ SequenceWithSuccessMessage_2'),
+        call('on_init SequenceWithSuccessMessage_2'),
+        call('__init__ HelloWorldAction'),
+        call('HelloWorldAction: Hello World !!!'),
+        call('__del__ HelloWorldAction'),
+        call('__init__ HelloWorldActionWithMessage'),
+        call('HelloWorldActionWithMessage: Hello World !!!'),
+        call('__del__ HelloWorldActionWithMessage'),
+        call('on_delete SequenceWithSuccessMessage_2'),
+        call('__del__ SequenceWithSuccessMessage_2')]
 
     def test_SequenceWithSuccessMessage_2(self):
         """Test the `SequenceWithSuccessMessage_2` node."""
@@ -595,19 +661,31 @@ class TestSequenceNode:
         assert bt_runner.get_status() == NodeStatus.SUCCESS
         assert bt_runner.get_contingency_message() == 'HELLOWORLD_PRINTED'
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ SequenceWithSuccessMessage_2'),
-                                       call('on_init SequenceWithSuccessMessage_2'),
-                                       call('__init__ HelloWorldAction'),
-                                       call('HelloWorldAction: Hello World !!!'),
-                                       call('__del__ HelloWorldAction'),
-                                       call('__init__ HelloWorldActionWithMessage'),
-                                       call('HelloWorldActionWithMessage: Hello World !!!'),
-                                       call('__del__ HelloWorldActionWithMessage'),
-                                       call('on_delete SequenceWithSuccessMessage_2'),
-                                       call('__del__ SequenceWithSuccessMessage_2')]
+        assert mock.call_args_list == self._calls_SequenceWithSuccessMessage_2
 
     ########################################################################
 
+    _calls_AddTwoNumbersSequence9_1 = [
+        call('__init__ AddTwoNumbersSequence9'),
+        call('on_init AddTwoNumbersSequence9'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('__init__ FixMissingNumbersAction'),
+        call('on_init FixMissingNumbersAction'),
+        call('FixMissingNumbersAction: fix missing numbers!'),
+        call('on_delete FixMissingNumbersAction'),
+        call('__del__ FixMissingNumbersAction'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 42!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('on_delete AddTwoNumbersSequence9'),
+        call('__del__ AddTwoNumbersSequence9')]
+
     def test_AddTwoNumbersSequence9_1(self):
         """Test the `AddTwoNumbersSequence9` node."""
         mock.reset_mock()
@@ -617,28 +695,18 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersSequence9'),
-                                       call('on_init AddTwoNumbersSequence9'),
-                                       call('__init__ AddTwoNumbersActionWithFailure'),
-                                       call('on_init AddTwoNumbersActionWithFailure'),
-                                       call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),  # noqa: E501
-                                       call('on_delete AddTwoNumbersActionWithFailure'),
-                                       call('__del__ AddTwoNumbersActionWithFailure'),
-                                       call('__init__ FixMissingNumbersAction'),
-                                       call('on_init FixMissingNumbersAction'),
-                                       call('FixMissingNumbersAction: fix missing numbers!'),
-                                       call('on_delete FixMissingNumbersAction'),
-                                       call('__del__ FixMissingNumbersAction'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 42!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('on_delete AddTwoNumbersSequence9'),
-                                       call('__del__ AddTwoNumbersSequence9')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersSequence9_1
 
     ########################################################################
 
+    _calls_AsyncAddChildSequence = [
+        call('__init__ AsyncAddChildSequence'),
+        call('on_init AsyncAddChildSequence'),
+        call('AsyncAddChildSequence: DONE'),
+        call('__init__ HelloWorldAction'),
+        call('HelloWorldAction: Hello World !!!'),
+        call('__del__ HelloWorldAction')]
+
     def test_AsyncAddChildSequence(self):
         """Test the `AsyncAddChildSequence` node."""
         mock.reset_mock()
@@ -648,15 +716,14 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AsyncAddChildSequence'),
-                                       call('on_init AsyncAddChildSequence'),
-                                       call('AsyncAddChildSequence: DONE'),
-                                       call('__init__ HelloWorldAction'),
-                                       call('HelloWorldAction: Hello World !!!'),
-                                       call('__del__ HelloWorldAction')]
+        assert mock.call_args_list == self._calls_AsyncAddChildSequence
 
     ########################################################################
 
+    _calls_RemoveAllChildrenSequence = [
+        call('__init__ RemoveAllChildrenSequence'),
+        call('on_init RemoveAllChildrenSequence')]
+
     def test_RemoveAllChildrenSequence(self):
         """Test the `RemoveAllChildrenSequence` node."""
         mock.reset_mock()
@@ -666,11 +733,42 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ RemoveAllChildrenSequence'),
-                                       call('on_init RemoveAllChildrenSequence')]
+        assert mock.call_args_list == self._calls_RemoveAllChildrenSequence
 
 ########################################################################
 
+    _calls_AddTwoNumbersDynamic = [
+        call('__init__ AddTwoNumbersAction'),
+        call('on_init AddTwoNumbersAction'),
+        call('AddTwoNumbersAction: calculating: 2 + 5 = 7'),
+        call('on_delete AddTwoNumbersAction'),
+        call('__del__ AddTwoNumbersAction'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 7!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('__init__ AddTwoNumbersAction'),
+        call('on_init AddTwoNumbersAction'),
+        call('AddTwoNumbersAction: calculating: 5 + 5 = 10'),
+        call('on_delete AddTwoNumbersAction'),
+        call('__del__ AddTwoNumbersAction'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 10!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction'),
+        call('__init__ AddTwoNumbersAction'),
+        call('on_init AddTwoNumbersAction'),
+        call('AddTwoNumbersAction: calculating: 9 + 5 = 14'),
+        call('on_delete AddTwoNumbersAction'),
+        call('__del__ AddTwoNumbersAction'),
+        call('__init__ ShowNumberAction'),
+        call('on_init ShowNumberAction'),
+        call('ShowNumberAction: The numer is: 14!'),
+        call('on_delete ShowNumberAction'),
+        call('__del__ ShowNumberAction')]
+
     def test_AddTwoNumbersDynamic(self):
         """Test the `AddTwoNumbersDynamic` node."""
         mock.reset_mock()
@@ -680,33 +778,133 @@ class TestSequenceNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
         print(mock.call_args_list)
-        assert mock.call_args_list == [call('__init__ AddTwoNumbersAction'),
-                                       call('on_init AddTwoNumbersAction'),
-                                       call('AddTwoNumbersAction: calculating: 2 + 5 = 7'),
-                                       call('on_delete AddTwoNumbersAction'),
-                                       call('__del__ AddTwoNumbersAction'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 7!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('__init__ AddTwoNumbersAction'),
-                                       call('on_init AddTwoNumbersAction'),
-                                       call('AddTwoNumbersAction: calculating: 5 + 5 = 10'),
-                                       call('on_delete AddTwoNumbersAction'),
-                                       call('__del__ AddTwoNumbersAction'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 10!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction'),
-                                       call('__init__ AddTwoNumbersAction'),
-                                       call('on_init AddTwoNumbersAction'),
-                                       call('AddTwoNumbersAction: calculating: 9 + 5 = 14'),
-                                       call('on_delete AddTwoNumbersAction'),
-                                       call('__del__ AddTwoNumbersAction'),
-                                       call('__init__ ShowNumberAction'),
-                                       call('on_init ShowNumberAction'),
-                                       call('ShowNumberAction: The numer is: 14!'),
-                                       call('on_delete ShowNumberAction'),
-                                       call('__del__ ShowNumberAction')]
+        assert mock.call_args_list == self._calls_AddTwoNumbersDynamic
+
+    ########################################################################
+
+    _calls_ContingencyMessageSequence_prefix = [
+        call('__init__ ContingencyMessageSequence'),
+        call('on_init ContingencyMessageSequence'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('on_delete ContingencyMessageSequence'),
+        call('__del__ ContingencyMessageSequence')]
+
+    def test_ContingencyMessageSequence_prefix(self):
+        """Test the `ContingencyMessageSequence` node with a prefix of the message.
+
+        The regex of the contingency-handler has to match the whole contingency
+        message, thus the prefix 'NOT_TWO_NUMBERS' does not trigger the handler.
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ContingencyMessageSequence, "'NOT_TWO_NUMBERS'")
+        assert mock.called
+        assert bt_runner._instance.get_status() == NodeStatus.FAILURE
+        assert bt_runner._instance.get_contingency_message() == 'NOT_TWO_NUMBERS_PROVIDED'
+        print(mock.call_args_list)
+        assert mock.call_args_list == self._calls_ContingencyMessageSequence_prefix
+
+    _calls_ContingencyMessageSequence_wildcard = [
+        call('__init__ ContingencyMessageSequence'),
+        call('on_init ContingencyMessageSequence'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('ContingencyMessageSequence: fix_missing_numbers_handler'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('on_delete ContingencyMessageSequence'),
+        call('__del__ ContingencyMessageSequence')]
+
+    def test_ContingencyMessageSequence_wildcard(self):
+        """Test the `ContingencyMessageSequence` node with a trailing wildcard.
+
+        The regex 'NOT_TWO_NUMBERS.*' matches the whole contingency message, thus
+        the handler is triggered and fixes the child.
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ContingencyMessageSequence, "'NOT_TWO_NUMBERS.*'")
+        assert mock.called
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        assert bt_runner._instance.get_contingency_message() == 'NOT_TWO_NUMBERS_PROVIDED'
+        print(mock.call_args_list)
+        assert mock.call_args_list == self._calls_ContingencyMessageSequence_wildcard
+
+    ########################################################################
+
+    _calls_ContingencyClassNameSequence = [
+        call('__init__ ContingencyClassNameSequence'),
+        call('on_init ContingencyClassNameSequence'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('on_delete ContingencyClassNameSequence'),
+        call('__del__ ContingencyClassNameSequence')]
+
+    def test_ContingencyClassNameSequence(self):
+        """Test the `ContingencyClassNameSequence` node.
+
+        A contingency-handler registered for the class `AddTwoNumbersAction` is
+        not triggered for the `AddTwoNumbersActionWithFailure`.
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ContingencyClassNameSequence)
+        assert mock.called
+        assert bt_runner._instance.get_status() == NodeStatus.FAILURE
+        assert bt_runner._instance.get_contingency_message() == 'NOT_TWO_NUMBERS_PROVIDED'
+        print(mock.call_args_list)
+        assert mock.call_args_list == self._calls_ContingencyClassNameSequence
+
+    ########################################################################
+
+    _calls_ContingencyOrderSequence_class_first = [
+        call('__init__ ContingencyOrderSequence'),
+        call('on_init ContingencyOrderSequence'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('ContingencyOrderSequence: class_handler'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('on_delete ContingencyOrderSequence'),
+        call('__del__ ContingencyOrderSequence')]
+
+    def test_ContingencyOrderSequence_class_first(self):
+        """Test the `ContingencyOrderSequence` node with the class handler first."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ContingencyOrderSequence, 'True')
+        assert mock.called
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        print(mock.call_args_list)
+        assert mock.call_args_list == self._calls_ContingencyOrderSequence_class_first
+
+    _calls_ContingencyOrderSequence_regex_first = [
+        call('__init__ ContingencyOrderSequence'),
+        call('on_init ContingencyOrderSequence'),
+        call('__init__ AddTwoNumbersActionWithFailure'),
+        call('on_init AddTwoNumbersActionWithFailure'),
+        call('AddTwoNumbersActionWithFailure: You did not provide two numbers!'),
+        call('ContingencyOrderSequence: regex_handler'),
+        call('on_delete AddTwoNumbersActionWithFailure'),
+        call('__del__ AddTwoNumbersActionWithFailure'),
+        call('on_delete ContingencyOrderSequence'),
+        call('__del__ ContingencyOrderSequence')]
+
+    def test_ContingencyOrderSequence_regex_first(self):
+        """Test the `ContingencyOrderSequence` node with the regex handler first."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ContingencyOrderSequence, 'False')
+        assert mock.called
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        print(mock.call_args_list)
+        assert mock.call_args_list == self._calls_ContingencyOrderSequence_regex_first
@@ -0,0 +1,141 @@
+# Copyright 2021 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Event
+from unittest.mock import call
+from unittest.mock import patch
+
+from carebt.treeNode import _TimeoutScheduler
+from tests.global_mock import mock
+
+# generous timeout to wait for the callbacks, thus a loaded machine
+# does not make the tests fail
+WAIT_TIMEOUT_S = 10
+
+
+class TimeoutReceiver():
+    """Receives the timeouts of the `_TimeoutScheduler`.
+
+    The scheduler only references bound methods weakly, thus the test keeps a
+    reference to the receiver. The event is set once the receiver was called
+    `repeat + 1` times.
+    """
+
+    def __init__(self, scheduler: _TimeoutScheduler, name: str, repeat: int = 0):
+        self.scheduler = scheduler
+        self.name = name
+        self.repeat = repeat
+        self.done = Event()
+
+    def on_timeout(self) -> None:
+        mock(f'on_timeout {self.name}')
+        if(self.repeat > 0):
+            self.repeat -= 1
+            self.scheduler.schedule(20, self.on_timeout)
+        else:
+            self.done.set()
+
+    def on_timeout_with_error(self) -> None:
+        mock(f'on_timeout_with_error {self.name}')
+        self.done.set()
+        raise RuntimeError('on_timeout failed')
+
+########################################################################
+
+
+class TestTimeoutScheduler:
+    """Test the `_TimeoutScheduler`."""
+
+    ########################################################################
+
+    def test_cancel(self):
+        """Test that a timeout canceled before its deadline is not called.
+
+        The timeouts are called in the order of their deadlines from one thread,
+        thus once the later timeout is called, the canceled one would have been
+        called before.
+        """
+        mock.reset_mock()
+        scheduler = _TimeoutScheduler()
+        receiver_a = TimeoutReceiver(scheduler, 'A')
+        receiver_b = TimeoutReceiver(scheduler, 'B')
+        scheduler.cancel(scheduler.schedule(20, receiver_a.on_timeout))
+        scheduler.schedule(50, receiver_b.on_timeout)
+        assert receiver_b.done.wait(WAIT_TIMEOUT_S)
+        assert mock.call_args_list == [call('on_timeout B')]
+
+    ########################################################################
+
+    def test_deadline_order(self):
+        """Test that the timeouts are called in the order of their deadlines."""
+        mock.reset_mock()
+        scheduler = _TimeoutScheduler()
+        receiver_a = TimeoutReceiver(scheduler, 'A')
+        receiver_b = TimeoutReceiver(scheduler, 'B')
+        receiver_c = TimeoutReceiver(scheduler, 'C')
+        scheduler.schedule(90, receiver_c.on_timeout)
+        scheduler.schedule(30, receiver_a.on_timeout)
+        scheduler.schedule(60, receiver_b.on_timeout)
+        assert receiver_c.done.wait(WAIT_TIMEOUT_S)
+        assert mock.call_args_list == [call('on_timeout A'),
+                                       call('on_timeout B'),
+                                       call('on_timeout C')]
+
+    ########################################################################
+
+    def test_reschedule_in_callback(self):
+        """Test a callback which schedules itself again."""
+        mock.reset_mock()
+        scheduler = _TimeoutScheduler()
+        receiver = TimeoutReceiver(scheduler, 'A', repeat=2)
+        scheduler.schedule(20, receiver.on_timeout)
+        assert receiver.done.wait(WAIT_TIMEOUT_S)
+        assert mock.call_args_list == [call('on_timeout A'),
+                                       call('on_timeout A'),
+                                       call('on_timeout A')]
+
+    ########################################################################
+
+    @patch('threading.excepthook')
+    def test_callback_raises(self, mock_excepthook):
+        """Test that the scheduler keeps running after a callback raised."""
+        mock.reset_mock()
+        scheduler = _TimeoutScheduler()
+        receiver_a = TimeoutReceiver(scheduler, 'A')
+        receiver_b = TimeoutReceiver(scheduler, 'B')
+        scheduler.schedule(20, receiver_a.on_timeout_with_error)
+        scheduler.schedule(50, receiver_b.on_timeout)
+        assert receiver_b.done.wait(WAIT_TIMEOUT_S)
+        assert mock.call_args_list == [call('on_timeout_with_error A'),
+                                       call('on_timeout B')]
+        assert mock_excepthook.call_count == 1
+        assert mock_excepthook.call_args[0][0].exc_type is RuntimeError
+
+    ########################################################################
+
+    def test_cancel_many(self):
+        """Test canceling many timeouts.
+
+        Canceling many timeouts compacts the heap of the scheduler. None of the
+        canceled timeouts is called, but the later timeout still is.
+        """
+        mock.reset_mock()
+        scheduler = _TimeoutScheduler()
+        receiver_a = TimeoutReceiver(scheduler, 'A')
+        receiver_b = TimeoutReceiver(scheduler, 'B')
+        for _ in range(1000):
+            scheduler.cancel(scheduler.schedule(20, receiver_a.on_timeout))
+        scheduler.schedule(50, receiver_b.on_timeout)
+        assert receiver_b.done.wait(WAIT_TIMEOUT_S)
+        assert mock.call_args_list == [call('on_timeout B')]